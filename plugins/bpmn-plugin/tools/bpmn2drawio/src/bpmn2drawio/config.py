@@ -1,14 +1,35 @@
 """Configuration loading for brand customization."""
 
 import os
+from dataclasses import fields, replace
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 
 import yaml
 
 from .exceptions import ConfigurationError
 from .themes import THEMES, BPMNTheme
 
+_THEME_FIELDS = frozenset(f.name for f in fields(BPMNTheme))
+
+# Nested "colors" sections and the theme fields their keys set
+_COLOR_SECTION_FIELDS: Dict[str, Dict[str, str]] = {
+    "events": {
+        "start_fill": "start_event_fill",
+        "start_stroke": "start_event_stroke",
+        "end_fill": "end_event_fill",
+        "end_stroke": "end_event_stroke",
+    },
+    "tasks": {"fill": "task_fill", "stroke": "task_stroke"},
+    "gateways": {"fill": "gateway_fill", "stroke": "gateway_stroke"},
+}
+
+_FONT_FIELDS: Dict[str, str] = {
+    "family": "font_family",
+    "size": "font_size",
+    "color": "font_color",
+}
+
 
 def load_brand_config(config_path: str) -> BPMNTheme:
     """Load brand configuration from YAML file.
@@ -56,97 +77,57 @@ def merge_theme_with_config(
     Returns:
         New BPMNTheme with merged values
     """
-    # Create dict of base theme values
-    theme_dict = {
-        "start_event_fill": base_theme.start_event_fill,
-        "start_event_stroke": base_theme.start_event_stroke,
-        "end_event_fill": base_theme.end_event_fill,
-        "end_event_stroke": base_theme.end_event_stroke,
-        "intermediate_event_fill": base_theme.intermediate_event_fill,
-        "intermediate_event_stroke": base_theme.intermediate_event_stroke,
-        "task_fill": base_theme.task_fill,
-        "task_stroke": base_theme.task_stroke,
-        "script_task_fill": base_theme.script_task_fill,
-        "script_task_stroke": base_theme.script_task_stroke,
-        "business_rule_task_fill": base_theme.business_rule_task_fill,
-        "business_rule_task_stroke": base_theme.business_rule_task_stroke,
-        "manual_task_fill": base_theme.manual_task_fill,
-        "manual_task_stroke": base_theme.manual_task_stroke,
-        "gateway_fill": base_theme.gateway_fill,
-        "gateway_stroke": base_theme.gateway_stroke,
-        "pool_fill": base_theme.pool_fill,
-        "pool_stroke": base_theme.pool_stroke,
-        "lane_fill": base_theme.lane_fill,
-        "lane_stroke": base_theme.lane_stroke,
-        "sequence_flow_stroke": base_theme.sequence_flow_stroke,
-        "message_flow_stroke": base_theme.message_flow_stroke,
-        "font_family": base_theme.font_family,
-        "font_size": base_theme.font_size,
-        "font_color": base_theme.font_color,
-    }
+    overrides: Dict[str, Any] = {}
 
     # Apply config overrides
     colors = config.get("colors", {})
     for key, value in colors.items():
-        if key in theme_dict:
-            theme_dict[key] = value
+        if key in _THEME_FIELDS:
+            overrides[key] = value
 
     # Handle nested sections
-    events = colors.get("events", {})
-    if "start_fill" in events:
-        theme_dict["start_event_fill"] = events["start_fill"]
-    if "start_stroke" in events:
-        theme_dict["start_event_stroke"] = events["start_stroke"]
-    if "end_fill" in events:
-        theme_dict["end_event_fill"] = events["end_fill"]
-    if "end_stroke" in events:
-        theme_dict["end_event_stroke"] = events["end_stroke"]
-
-    tasks = colors.get("tasks", {})
-    if "fill" in tasks:
-        theme_dict["task_fill"] = tasks["fill"]
-    if "stroke" in tasks:
-        theme_dict["task_stroke"] = tasks["stroke"]
-
-    gateways = colors.get("gateways", {})
-    if "fill" in gateways:
-        theme_dict["gateway_fill"] = gateways["fill"]
-    if "stroke" in gateways:
-        theme_dict["gateway_stroke"] = gateways["stroke"]
+    for section, field_map in _COLOR_SECTION_FIELDS.items():
+        values = colors.get(section, {})
+        for key, field_name in field_map.items():
+            if key in values:
+                overrides[field_name] = values[key]
 
     # Handle fonts
     fonts = config.get("fonts", {})
-    if "family" in fonts:
-        theme_dict["font_family"] = fonts["family"]
-    if "size" in fonts:
-        theme_dict["font_size"] = fonts["size"]
-    if "color" in fonts:
-        theme_dict["font_color"] = fonts["color"]
+    for key, field_name in _FONT_FIELDS.items():
+        if key in fonts:
+            overrides[field_name] = fonts[key]
 
-    return BPMNTheme(**theme_dict)
+    return replace(base_theme, **overrides)
 
 
-def get_env_config() -> Dict[str, Any]:
+def get_env_config(env: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
     """Get configuration from environment variables.
 
+    Args:
+        env: Variables to read; defaults to ``os.environ``
+
     Returns:
         Configuration dictionary
     """
+    if env is None:
+        env = os.environ
+
     config = {}
 
-    theme = os.environ.get("BPMN2DRAWIO_THEME")
+    theme = env.get("BPMN2DRAWIO_THEME")
     if theme:
         config["theme"] = theme
 
-    layout = os.environ.get("BPMN2DRAWIO_LAYOUT")
+    layout = env.get("BPMN2DRAWIO_LAYOUT")
     if layout:
         config["layout"] = layout
 
-    direction = os.environ.get("BPMN2DRAWIO_DIRECTION")
+    direction = env.get("BPMN2DRAWIO_DIRECTION")
     if direction:
         config["direction"] = direction
 
-    graphviz_path = os.environ.get("BPMN2DRAWIO_GRAPHVIZ_PATH")
+    graphviz_path = env.get("BPMN2DRAWIO_GRAPHVIZ_PATH")
     if graphviz_path:
         config["graphviz_path"] = graphviz_path
 
@@ -108,11 +108,13 @@ class Converter:
                 error=str(e),
             )
 
-    def convert_string(self, bpmn_xml: str) -> str:
+    def convert_string(self, bpmn_xml: Union[str, Path]) -> str:
         """Convert BPMN XML string to Draw.io XML string.
 
+        The result is returned in memory without writing an output file.
+
         Args:
-            bpmn_xml: BPMN XML string
+            bpmn_xml: BPMN XML string, or path to a BPMN file
 
         Returns:
             Draw.io XML string
@@ -4,9 +4,13 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class BPMNElement:
-    """Represents a BPMN element (task, event, gateway, etc.)."""
+    """Represents a BPMN element (task, event, gateway, etc.).
+
+    Uses ``__slots__``: diagrams hold many elements and geometry fields
+    are read on every layout and routing pass.
+    """
 
     id: str
     type: str  # e.g., "userTask", "exclusiveGateway", "startEvent"
@@ -1,5 +1,6 @@
 """Position resolver for BPMN elements."""
 
+import threading
 from copy import deepcopy
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -9,6 +10,10 @@ from .lane_organizer import LaneOrganizer
 from .layout import LayoutEngine
 from .models import BPMNElement, BPMNModel
 
+# Per-thread pool of resolvers keyed by (direction, use_layout). Resolvers keep
+# no per-call state, so a pooled instance can be reused without resetting.
+_RESOLVER_POOL = threading.local()
+
 
 class PositionResolver:
     """Resolve element positions from DI or layout engine."""
@@ -527,7 +532,8 @@ def resolve_positions(
 ) -> BPMNModel:
     """Resolve positions for all elements in a model.
 
-    Convenience function for position resolution.
+    Convenience function for position resolution. Resolvers are pooled per
+    thread and per configuration so batch conversions reuse them.
 
     Args:
         model: BPMN model
@@ -537,6 +543,27 @@ def resolve_positions(
     Returns:
         Model with resolved positions
     """
-    layout_engine = LayoutEngine(direction=direction)
-    resolver = PositionResolver(layout_engine=layout_engine, use_layout=use_layout)
-    return resolver.resolve(model)
+    return _get_pooled_resolver(direction, use_layout).resolve(model)
+
+
+def _get_pooled_resolver(direction: str, use_layout: str) -> PositionResolver:
+    """Get this thread's resolver for a layout configuration, creating it once.
+
+    Args:
+        direction: Flow direction for layout
+        use_layout: Layout mode
+
+    Returns:
+        PositionResolver configured for the given direction and layout mode
+    """
+    resolvers = getattr(_RESOLVER_POOL, "resolvers", None)
+    if resolvers is None:
+        resolvers = _RESOLVER_POOL.resolvers = {}
+
+    key = (direction, use_layout)
+    resolver = resolvers.get(key)
+    if resolver is None:
+        layout_engine = LayoutEngine(direction=direction)
+        resolver = PositionResolver(layout_engine=layout_engine, use_layout=use_layout)
+        resolvers[key] = resolver
+    return resolver
@@ -9,6 +9,12 @@ from .styles import STYLE_MAP
 
 logger = logging.getLogger(__name__)
 
+# Fallback grid used when DI coordinates are missing
+GRID_COLUMNS = 5
+GRID_X_SPACING = 150
+GRID_Y_SPACING = 100
+GRID_MARGIN = 100
+
 
 class RecoveryStrategy:
     """Handle errors gracefully with fallbacks."""
@@ -23,13 +29,15 @@ class RecoveryStrategy:
             element: Element with missing coordinates
             index: Element index for grid positioning
         """
+        row, col = divmod(index, GRID_COLUMNS)
+
         if element.x is None:
-            element.x = 100 + (index % 5) * 150
+            element.x = GRID_MARGIN + col * GRID_X_SPACING
             self.recovered_count += 1
             logger.debug(f"Assigned default x={element.x} to {element.id}")
 
         if element.y is None:
-            element.y = 100 + (index // 5) * 100
+            element.y = GRID_MARGIN + row * GRID_Y_SPACING
             logger.debug(f"Assigned default y={element.y} to {element.id}")
 
         if element.width is None or element.height is None:
@@ -105,15 +113,13 @@ class RecoveryStrategy:
         self.recovered_count += 1
 
         positions = {}
-        elements_per_row = 5
-        x_spacing = 150
-        y_spacing = 100
-        margin = 100
 
         for i, element in enumerate(model.elements):
-            row = i // elements_per_row
-            col = i % elements_per_row
-            positions[element.id] = (margin + col * x_spacing, margin + row * y_spacing)
+            row, col = divmod(i, GRID_COLUMNS)
+            positions[element.id] = (
+                GRID_MARGIN + col * GRID_X_SPACING,
+                GRID_MARGIN + row * GRID_Y_SPACING,
+            )
 
         return positions
 
@@ -4,6 +4,50 @@ from typing import Dict, List, Optional, Tuple
 
 from .models import BPMNElement, BPMNFlow
 
+# Element bounds as (x, y, width, height) with defaults already applied
+Bounds = Tuple[float, float, float, float]
+
+
+def _element_bounds(element: BPMNElement) -> Bounds:
+    """Resolve element geometry, substituting defaults for missing values.
+
+    Args:
+        element: BPMN element
+
+    Returns:
+        (x, y, width, height) tuple
+    """
+    return (
+        element.x or 0,
+        element.y or 0,
+        element.width or 120,
+        element.height or 80,
+    )
+
+
+def _connection_point(bounds: Bounds, direction: str) -> Tuple[float, float]:
+    """Get connection point on the edge of a bounding box.
+
+    Args:
+        bounds: (x, y, width, height) tuple
+        direction: Connection direction (left, right, top, bottom)
+
+    Returns:
+        (x, y) connection point
+    """
+    x, y, width, height = bounds
+
+    if direction == "left":
+        return (x, y + height / 2)
+    elif direction == "right":
+        return (x + width, y + height / 2)
+    elif direction == "top":
+        return (x + width / 2, y)
+    elif direction == "bottom":
+        return (x + width / 2, y + height)
+    else:
+        return (x + width / 2, y + height / 2)
+
 
 class EdgeRouter:
     """Calculate edge routes between elements."""
@@ -57,24 +101,7 @@ class EdgeRouter:
         Returns:
             (x, y) connection point
         """
-        x = element.x or 0
-        y = element.y or 0
-        width = element.width or 120
-        height = element.height or 80
-
-        center_x = x + width / 2
-        center_y = y + height / 2
-
-        if direction == "left":
-            return (x, center_y)
-        elif direction == "right":
-            return (x + width, center_y)
-        elif direction == "top":
-            return (center_x, y)
-        elif direction == "bottom":
-            return (center_x, y + height)
-        else:
-            return (center_x, center_y)
+        return _connection_point(_element_bounds(element), direction)
 
     def _orthogonal_route(
         self,
@@ -92,29 +119,32 @@ class EdgeRouter:
         """
         waypoints = []
 
+        src_bounds = _element_bounds(source)
+        tgt_bounds = _element_bounds(target)
+
         # Get element centers
-        src_x = (source.x or 0) + (source.width or 120) / 2
-        src_y = (source.y or 0) + (source.height or 80) / 2
-        tgt_x = (target.x or 0) + (target.width or 120) / 2
-        tgt_y = (target.y or 0) + (target.height or 80) / 2
+        src_x = src_bounds[0] + src_bounds[2] / 2
+        src_y = src_bounds[1] + src_bounds[3] / 2
+        tgt_x = tgt_bounds[0] + tgt_bounds[2] / 2
+        tgt_y = tgt_bounds[1] + tgt_bounds[3] / 2
 
         # Determine connection points based on relative positions
         if tgt_x > src_x:
             # Target is to the right
-            src_point = self._get_connection_point(source, "right")
-            tgt_point = self._get_connection_point(target, "left")
+            src_point = _connection_point(src_bounds, "right")
+            tgt_point = _connection_point(tgt_bounds, "left")
         elif tgt_x < src_x:
             # Target is to the left
-            src_point = self._get_connection_point(source, "left")
-            tgt_point = self._get_connection_point(target, "right")
+            src_point = _connection_point(src_bounds, "left")
+            tgt_point = _connection_point(tgt_bounds, "right")
         elif tgt_y > src_y:
             # Target is below
-            src_point = self._get_connection_point(source, "bottom")
-            tgt_point = self._get_connection_point(target, "top")
+            src_point = _connection_point(src_bounds, "bottom")
+            tgt_point = _connection_point(tgt_bounds, "top")
         else:
             # Target is above
-            src_point = self._get_connection_point(source, "top")
-            tgt_point = self._get_connection_point(target, "bottom")
+            src_point = _connection_point(src_bounds, "top")
+            tgt_point = _connection_point(tgt_bounds, "bottom")
 
         waypoints.append(src_point)
 
@@ -1,6 +1,6 @@
 """Style mappings for Draw.io elements."""
 
-from typing import Dict
+from typing import Dict, Tuple
 
 # Style mappings for BPMN elements to Draw.io styles
 STYLE_MAP: Dict[str, str] = {
@@ -68,18 +68,18 @@ def get_element_style(element_type: str) -> str:
     return STYLE_MAP.get(element_type, STYLE_MAP["task"])
 
 
-def get_edge_style(flow_type: str, is_default: bool = False, has_condition: bool = False) -> str:
-    """Get Draw.io style string for a flow type.
+def _build_edge_style(flow_type: str, is_default: bool, has_condition: bool) -> str:
+    """Build the Draw.io style string for a known flow type and marker flags.
 
     Args:
-        flow_type: BPMN flow type
+        flow_type: BPMN flow type (a key of EDGE_STYLES)
         is_default: Whether this is a default flow
         has_condition: Whether this flow has a condition
 
     Returns:
         Draw.io style string
     """
-    base_style = EDGE_STYLES.get(flow_type, EDGE_STYLES["sequenceFlow"])
+    base_style = EDGE_STYLES[flow_type]
 
     if flow_type == "sequenceFlow":
         if is_default:
@@ -96,3 +96,32 @@ def get_edge_style(flow_type: str, is_default: bool = False, has_condition: bool
             )
 
     return base_style
+
+
+# Every (flow_type, is_default, has_condition) combination, built once at import
+_EDGE_STYLE_TABLE: Dict[Tuple[str, bool, bool], str] = {
+    (flow_type, is_default, has_condition): _build_edge_style(flow_type, is_default, has_condition)
+    for flow_type in EDGE_STYLES
+    for is_default in (False, True)
+    for has_condition in (False, True)
+}
+
+
+def get_edge_style(flow_type: str, is_default: bool = False, has_condition: bool = False) -> str:
+    """Get Draw.io style string for a flow type.
+
+    Styles come from a table precomputed at import; unknown flow types fall
+    back to the plain sequence flow style without markers.
+
+    Args:
+        flow_type: BPMN flow type
+        is_default: Whether this is a default flow
+        has_condition: Whether this flow has a condition
+
+    Returns:
+        Draw.io style string
+    """
+    style = _EDGE_STYLE_TABLE.get((flow_type, bool(is_default), bool(has_condition)))
+    if style is None:
+        return EDGE_STYLES["sequenceFlow"]
+    return style
@@ -1,7 +1,9 @@
 """Validation system for BPMN models."""
 
+import heapq
 from dataclasses import dataclass
-from typing import List, Optional, Set
+from operator import itemgetter
+from typing import List, Optional, Set, Tuple
 
 from .models import BPMNElement, BPMNModel
 
@@ -29,9 +31,12 @@ class ModelValidator:
         """
         warnings = []
 
+        # Shared by the reference and connectivity checks
+        element_ids = {e.id for e in model.elements}
+
         warnings.extend(self._check_start_end_events(model))
-        warnings.extend(self._check_valid_references(model))
-        warnings.extend(self._check_connected_graph(model))
+        warnings.extend(self._check_valid_references(model, element_ids))
+        warnings.extend(self._check_connected_graph(model, element_ids))
         warnings.extend(self._check_overlapping_elements(model))
         warnings.extend(self._check_missing_labels(model))
 
@@ -62,10 +67,13 @@ class ModelValidator:
 
         return warnings
 
-    def _check_valid_references(self, model: BPMNModel) -> List[ValidationWarning]:
+    def _check_valid_references(
+        self, model: BPMNModel, element_ids: Optional[Set[str]] = None
+    ) -> List[ValidationWarning]:
         """Verify sourceRef/targetRef point to existing elements."""
         warnings = []
-        element_ids = {e.id for e in model.elements}
+        if element_ids is None:
+            element_ids = {e.id for e in model.elements}
 
         for flow in model.flows:
             if flow.source_ref not in element_ids:
@@ -92,15 +100,20 @@ class ModelValidator:
 
         return warnings
 
-    def _check_connected_graph(self, model: BPMNModel) -> List[ValidationWarning]:
+    def _check_connected_graph(
+        self, model: BPMNModel, element_ids: Optional[Set[str]] = None
+    ) -> List[ValidationWarning]:
         """Check all elements reachable from start."""
         warnings = []
 
         if not model.elements:
             return warnings
 
+        if element_ids is None:
+            element_ids = {e.id for e in model.elements}
+
         # Build adjacency map
-        adjacency: dict = {e.id: set() for e in model.elements}
+        adjacency: dict = {elem_id: set() for elem_id in element_ids}
         for flow in model.flows:
             if flow.source_ref in adjacency and flow.target_ref in adjacency:
                 adjacency[flow.source_ref].add(flow.target_ref)
@@ -124,8 +137,7 @@ class ModelValidator:
             queue.extend(adjacency.get(current, set()) - visited)
 
         # Check for unreachable elements
-        all_ids = {e.id for e in model.elements}
-        unreachable = all_ids - visited
+        unreachable = element_ids - visited
 
         for elem_id in unreachable:
             warnings.append(
@@ -142,42 +154,49 @@ class ModelValidator:
         """Detect overlapping element positions."""
         warnings = []
 
-        # Only check elements with coordinates
-        positioned_elements = [
-            e
-            for e in model.elements
-            if e.x is not None and e.y is not None and e.width is not None and e.height is not None
-        ]
-
-        for i, elem1 in enumerate(positioned_elements):
-            for elem2 in positioned_elements[i + 1 :]:
-                if self._elements_overlap(elem1, elem2):
-                    warnings.append(
-                        ValidationWarning(
-                            level="warning",
-                            element_id=elem1.id,
-                            message=f"Element '{elem1.id}' overlaps with '{elem2.id}'",
-                        )
-                    )
+        # Only check elements with coordinates; boxes are (x, y, width, height, index)
+        positioned_elements: List[BPMNElement] = []
+        boxes: List[Tuple[float, float, float, float, int]] = []
+        for e in model.elements:
+            if e.x is not None and e.y is not None and e.width is not None and e.height is not None:
+                boxes.append((e.x, e.y, e.width, e.height, len(positioned_elements)))
+                positioned_elements.append(e)
+
+        # Sweep left to right, keeping only boxes whose right edge is past
+        # the current x; anything that has ended can no longer overlap.
+        active: List[Tuple[float, int]] = []  # min-heap of (right edge, index)
+        pairs = []
+
+        for x, y, width, height, j in sorted(boxes, key=itemgetter(0)):
+            while active and active[0][0] <= x:
+                heapq.heappop(active)
+            right = x + width
+            bottom = y + height
+            for _, i in active:
+                other_x, other_y, other_width, other_height, _ = boxes[i]
+                if (
+                    x < other_x + other_width
+                    and other_x < right
+                    and y < other_y + other_height
+                    and other_y < bottom
+                ):
+                    pairs.append((i, j) if i < j else (j, i))
+            heapq.heappush(active, (right, j))
+
+        # Report in document order, matching a pairwise scan
+        for i, j in sorted(pairs):
+            elem1 = positioned_elements[i]
+            elem2 = positioned_elements[j]
+            warnings.append(
+                ValidationWarning(
+                    level="warning",
+                    element_id=elem1.id,
+                    message=f"Element '{elem1.id}' overlaps with '{elem2.id}'",
+                )
+            )
 
         return warnings
 
-    def _elements_overlap(self, e1: BPMNElement, e2: BPMNElement) -> bool:
-        """Check if two elements overlap."""
-        # Use bounding box intersection
-        e1_right = e1.x + e1.width
-        e1_bottom = e1.y + e1.height
-        e2_right = e2.x + e2.width
-        e2_bottom = e2.y + e2.height
-
-        # Check for no overlap conditions
-        if e1.x >= e2_right or e2.x >= e1_right:
-            return False
-        if e1.y >= e2_bottom or e2.y >= e1_bottom:
-            return False
-
-        return True
-
     def _check_missing_labels(self, model: BPMNModel) -> List[ValidationWarning]:
         """Warn about elements without labels."""
         warnings = []
@@ -1,14 +1,21 @@
 """Waypoint calculation and conversion for BPMN flows."""
 
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from xml.etree import ElementTree as ET
 
 from .models import BPMNElement, BPMNFlow
+from .routing import Bounds, _element_bounds
+
+# Waypoint representation used throughout this module. Routes are lists of
+# (x, y) tuples at the public boundary; callers may pass any sequence.
+Point = Tuple[float, float]
+Waypoints = List[Point]
 
 
 def convert_bpmn_waypoints(
     di_waypoints: List[Dict],
-) -> List[Tuple[float, float]]:
+) -> Waypoints:
     """Convert BPMN DI waypoints to Draw.io format.
 
     Args:
@@ -17,19 +24,14 @@ def convert_bpmn_waypoints(
     Returns:
         List of (x, y) tuples
     """
-    waypoints = []
-    for wp in di_waypoints:
-        x = float(wp.get("x", 0))
-        y = float(wp.get("y", 0))
-        waypoints.append((x, y))
-    return waypoints
+    return [(float(wp.get("x", 0)), float(wp.get("y", 0))) for wp in di_waypoints]
 
 
 def generate_waypoints(
     source: BPMNElement,
     target: BPMNElement,
     routing_style: str = "orthogonal",
-) -> List[Tuple[float, float]]:
+) -> Waypoints:
     """Generate waypoints when DI doesn't provide them.
 
     Args:
@@ -40,81 +42,125 @@ def generate_waypoints(
     Returns:
         List of waypoints
     """
-    src_x = (source.x or 0) + (source.width or 120) / 2
-    src_y = (source.y or 0) + (source.height or 80) / 2
-    tgt_x = (target.x or 0) + (target.width or 120) / 2
-    tgt_y = (target.y or 0) + (target.height or 80) / 2
+    src = _element_bounds(source)
+    tgt = _element_bounds(target)
 
     if routing_style == "direct":
-        return [(src_x, src_y), (tgt_x, tgt_y)]
+        # Two centers are cheaper to compute than a memo lookup, and keeping
+        # direct routes out of the memo leaves room for orthogonal ones.
+        src_center = _center(src)
+        return [src_center, src_center if tgt == src else _center(tgt)]
+
+    return list(_waypoints_cached(*src, *tgt, routing_style))
+
+
+def _center(bounds: Bounds) -> Point:
+    """Return the center point of an (x, y, width, height) tuple."""
+    x, y, width, height = bounds
+    return (x + width / 2, y + height / 2)
+
+
+# Keyed on geometry rather than element ids, so duplicate edges and
+# identically sized elements share entries. typed=True keeps int and float
+# geometry apart so cached points keep the numeric type of the caller's
+# coordinates.
+@lru_cache(maxsize=4096, typed=True)
+def _waypoints_cached(
+    sx: float,
+    sy: float,
+    sw: float,
+    sh: float,
+    tx: float,
+    ty: float,
+    tw: float,
+    th: float,
+    routing_style: str,
+) -> Tuple[Point, ...]:
+    """Compute orthogonal waypoints between two rectangles.
+
+    Args:
+        sx, sy, sw, sh: Source position and size
+        tx, ty, tw, th: Target position and size
+        routing_style: Routing style; orthogonal only, since
+            generate_waypoints handles direct routes itself
 
-    # Orthogonal routing
-    waypoints = []
+    Returns:
+        Tuple of waypoints
+    """
+    half_sw = sw / 2
+    half_tw = tw / 2
+    src_x = sx + half_sw
+    src_y = sy + sh / 2
+    tgt_x = tx + half_tw
+    tgt_y = ty + th / 2
 
     # Source exit point
-    if tgt_x > src_x + (source.width or 120) / 2:
-        src_exit = ((source.x or 0) + (source.width or 120), src_y)
-    elif tgt_x < src_x - (source.width or 120) / 2:
-        src_exit = (source.x or 0, src_y)
+    if tgt_x > src_x + half_sw:
+        src_exit = (sx + sw, src_y)
+    elif tgt_x < src_x - half_sw:
+        src_exit = (sx, src_y)
     elif tgt_y > src_y:
-        src_exit = (src_x, (source.y or 0) + (source.height or 80))
+        src_exit = (src_x, sy + sh)
     else:
-        src_exit = (src_x, source.y or 0)
-
-    waypoints.append(src_exit)
+        src_exit = (src_x, sy)
 
     # Target entry point
-    if src_x > tgt_x + (target.width or 120) / 2:
-        tgt_entry = ((target.x or 0) + (target.width or 120), tgt_y)
-    elif src_x < tgt_x - (target.width or 120) / 2:
-        tgt_entry = (target.x or 0, tgt_y)
+    if src_x > tgt_x + half_tw:
+        tgt_entry = (tx + tw, tgt_y)
+    elif src_x < tgt_x - half_tw:
+        tgt_entry = (tx, tgt_y)
     elif src_y > tgt_y:
-        tgt_entry = (tgt_x, (target.y or 0) + (target.height or 80))
+        tgt_entry = (tgt_x, ty + th)
     else:
-        tgt_entry = (tgt_x, target.y or 0)
+        tgt_entry = (tgt_x, ty)
 
-    # Add intermediate point if needed
-    if abs(src_exit[0] - tgt_entry[0]) > 10 and abs(src_exit[1] - tgt_entry[1]) > 10:
+    # Add intermediate points if needed: both deltas must exceed 10.
+    # Signed comparisons avoid two abs() calls on this per-edge path.
+    dx = src_exit[0] - tgt_entry[0]
+    dy = src_exit[1] - tgt_entry[1]
+    if (dx > 10 or dx < -10) and (dy > 10 or dy < -10):
         mid_x = (src_exit[0] + tgt_entry[0]) / 2
-        waypoints.append((mid_x, src_exit[1]))
-        waypoints.append((mid_x, tgt_entry[1]))
+        return (src_exit, (mid_x, src_exit[1]), (mid_x, tgt_entry[1]), tgt_entry)
 
-    waypoints.append(tgt_entry)
+    if tgt_entry == src_exit:
+        # Self-loops and touching elements: share one point object
+        return (src_exit, src_exit)
 
-    return waypoints
+    return (src_exit, tgt_entry)
+
+
+def clear_waypoint_cache() -> None:
+    """Drop memoized routes, e.g. between documents in a long-running service."""
+    _waypoints_cached.cache_clear()
 
 
 def create_waypoint_array(
-    waypoints: List[Tuple[float, float]],
+    waypoints: Sequence[Point],
 ) -> Optional[ET.Element]:
     """Create mxPoint Array element for edge geometry.
 
     Args:
-        waypoints: List of waypoints
+        waypoints: Sequence of waypoints; any list or tuple of (x, y)
+            pairs is used as-is, without copying into a new list first
 
     Returns:
         Array element or None if no intermediate waypoints
     """
-    # Skip first and last (source/target connection points)
-    intermediate = waypoints[1:-1] if len(waypoints) > 2 else []
-
-    if not intermediate:
+    # Straight edges have no intermediate points; skip the slice entirely
+    if len(waypoints) <= 2:
         return None
 
-    array = ET.Element("Array")
-    array.set("as", "points")
-
-    for x, y in intermediate:
-        point = ET.SubElement(array, "mxPoint")
-        point.set("x", str(x))
-        point.set("y", str(y))
+    array = ET.Element("Array", {"as": "points"})
+    # Skip first and last (source/target connection points)
+    for x, y in waypoints[1:-1]:
+        ET.SubElement(array, "mxPoint", {"x": str(x), "y": str(y)})
 
     return array
 
 
 def position_edge_label(
     flow: BPMNFlow,
-    waypoints: List[Tuple[float, float]],
+    waypoints: Sequence[Point],
 ) -> Dict[str, Any]:
     """Calculate label position along edge midpoint.
 
@@ -128,18 +174,18 @@ def position_edge_label(
     if not flow.name:
         return {}
 
-    if len(waypoints) < 2:
+    count = len(waypoints)
+    if count < 2:
         return {"x": 0.5, "y": 0}
 
     # Find midpoint
-    if len(waypoints) == 2:
-        mid_x = (waypoints[0][0] + waypoints[1][0]) / 2
-        mid_y = (waypoints[0][1] + waypoints[1][1]) / 2
+    if count == 2:
+        (x0, y0), (x1, y1) = waypoints
+        mid_x = (x0 + x1) / 2
+        mid_y = (y0 + y1) / 2
     else:
         # Use middle waypoint
-        mid_idx = len(waypoints) // 2
-        mid_x = waypoints[mid_idx][0]
-        mid_y = waypoints[mid_idx][1]
+        mid_x, mid_y = waypoints[count // 2]
 
     return {
         "x": mid_x,
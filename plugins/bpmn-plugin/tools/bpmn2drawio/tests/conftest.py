@@ -0,0 +1,77 @@
+"""Shared fixtures for bpmn2drawio tests.
+
+Session-scoped caches are per process; under ``pytest -n auto`` each
+xdist worker builds its own.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from bpmn2drawio.converter import Converter
+from bpmn2drawio.parser import parse_bpmn
+from bpmn2drawio.validation import validate_model
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def parsed_bpmn():
+    """Return a loader that parses each BPMN fixture at most once per session.
+
+    Models are shared between tests and must be treated as read-only;
+    tests that mutate a model should ``copy.deepcopy`` it first.
+    """
+    cache = {}
+
+    def _get(path):
+        key = str(path)
+        if key not in cache:
+            cache[key] = parse_bpmn(path)
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def validated(parsed_bpmn):
+    """Return a loader that runs ``validate_model`` once per BPMN fixture.
+
+    The returned warning lists are shared between tests and must not be
+    modified.
+    """
+    cache = {}
+
+    def _validate(path):
+        key = str(path)
+        if key not in cache:
+            cache[key] = validate_model(parsed_bpmn(path))
+        return cache[key]
+
+    return _validate
+
+
+@pytest.fixture(scope="session")
+def conditional_model(parsed_bpmn):
+    """Parsed conditional_flows.bpmn, shared read-only across the session."""
+    return parsed_bpmn(FIXTURES_DIR / "conditional_flows.bpmn")
+
+
+@pytest.fixture(scope="session")
+def converter():
+    """Default-configured Converter shared across the session.
+
+    Converter keeps no per-conversion state, so one instance can serve
+    every test that does not need a custom layout, theme, or config.
+    """
+    return Converter()
+
+
+@pytest.fixture(scope="session")
+def style_tokens():
+    """Return a splitter from a Draw.io style string to its ``key=value`` tokens."""
+
+    def _split(style):
+        return frozenset(style.rstrip(";").split(";"))
+
+    return _split
@@ -0,0 +1,20 @@
+"""Draw.io style tokens asserted across the style, routing and swimlane tests.
+
+Importing a misspelled name fails loudly, where a mistyped string literal
+would silently never match.
+"""
+
+DASHED = "dashed=1"
+ELLIPSE = "ellipse"
+END_ARROW_BLOCK = "endArrow=block"
+END_ARROW_NONE = "endArrow=none"
+END_FILL = "endFill=1"
+HTML = "html=1"
+ORTHOGONAL_EDGE = "edgeStyle=orthogonalEdgeStyle"
+RHOMBUS = "rhombus"
+ROUNDED = "rounded=1"
+START_ARROW_DASH = "startArrow=dash"
+START_ARROW_DIAMOND = "startArrow=diamond"
+START_ARROW_OVAL = "startArrow=oval"
+START_FILL_OPEN = "startFill=0"
+SWIMLANE = "swimlane"
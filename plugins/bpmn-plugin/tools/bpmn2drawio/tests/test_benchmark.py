@@ -0,0 +1,34 @@
+"""Performance regression benchmarks for the conversion pipeline.
+
+Skipped in the normal suite. Run with
+``pytest tests/test_benchmark.py --benchmark-only``. Save a baseline
+with ``--benchmark-autosave`` and compare later runs against it with
+``--benchmark-compare``.
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def _benchmarks_requested(request):
+    """Skip unless benchmarks were asked for on the command line."""
+    option = request.config.getoption
+    if not (option("benchmark_only") or option("benchmark_enable")):
+        pytest.skip("benchmarks run only with --benchmark-only or --benchmark-enable")
+
+
+@pytest.mark.benchmark(group="convert", min_rounds=20, max_time=0.5, warmup=True)
+def test_bench_convert_conditional_flows(benchmark, converter, tmp_path):
+    """Benchmark a full parse-layout-generate run on conditional_flows.bpmn."""
+    output_file = tmp_path / "conditional.drawio"
+
+    result = benchmark(converter.convert, FIXTURES_DIR / "conditional_flows.bpmn", output_file)
+
+    assert result.success
+    assert result.flow_count >= 7
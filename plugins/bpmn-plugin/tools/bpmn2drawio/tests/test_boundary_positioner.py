@@ -4,8 +4,13 @@ Tests the extracted boundary event positioning, subprocess coordinate
 adjustment, and laneless pool parent assignment logic.
 """
 
+from pathlib import Path
+
 from bpmn2drawio.models import BPMNElement, BPMNModel, Pool, Lane
 from bpmn2drawio.boundary_positioner import BoundaryPositioner
+from bpmn2drawio.parser import parse_bpmn
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
 # ---------------------------------------------------------------------------
@@ -226,6 +231,28 @@ class TestAdjustSubprocessInternalPositions:
         assert elem.x == 100
         assert elem.y == 100
 
+    def test_subprocess_added_after_parse_is_adjusted(self):
+        """A subprocess appended to a parsed flat model is still handled."""
+        model = parse_bpmn(FIXTURES_DIR / "minimal.bpmn")
+        sub = make_element(
+            "sub1",
+            type="subProcess",
+            x=200,
+            y=200,
+            width=300,
+            height=250,
+            properties={"_is_subprocess": True},
+        )
+        internal = make_element(
+            "int1", x=250, y=260, width=80, height=60, subprocess_id="sub1"
+        )
+        model.elements.extend([sub, internal])
+
+        self._positioner().adjust_subprocess_internal_positions(model)
+
+        assert internal.x == 50
+        assert internal.y == 34
+
     def test_internal_clamped_to_subprocess_bounds(self):
         """Internal element coordinates are clamped within subprocess bounds."""
         sub = make_element(
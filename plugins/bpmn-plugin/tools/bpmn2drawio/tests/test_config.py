@@ -356,6 +356,13 @@ class TestMergeThemeWithConfig:
         assert result.font_size == 16
         assert result.font_color == "#000000"
 
+    def test_merge_nested_section_wins_over_top_level_key(self):
+        """A nested section value overrides the same field set at top level."""
+        base = BPMNTheme()
+        config = {"colors": {"task_fill": "#top", "tasks": {"fill": "#nested"}}}
+        result = merge_theme_with_config(base, config)
+        assert result.task_fill == "#nested"
+
     def test_merge_does_not_mutate_base_theme(self):
         """Merging creates a new theme; the base is not modified."""
         base = BPMNTheme()
@@ -373,51 +380,49 @@ class TestMergeThemeWithConfig:
 class TestGetEnvConfig:
     """Tests for environment variable configuration."""
 
-    def test_empty_env_returns_empty_dict(self, monkeypatch):
+    def test_empty_env_returns_empty_dict(self):
         """No BPMN2DRAWIO_* env vars returns empty dict."""
-        for var in (
-            "BPMN2DRAWIO_THEME",
-            "BPMN2DRAWIO_LAYOUT",
-            "BPMN2DRAWIO_DIRECTION",
-            "BPMN2DRAWIO_GRAPHVIZ_PATH",
-        ):
-            monkeypatch.delenv(var, raising=False)
-        config = get_env_config()
+        config = get_env_config({})
         assert config == {}
 
-    def test_theme_env_var(self, monkeypatch):
+    def test_theme_env_var(self):
         """BPMN2DRAWIO_THEME env var populates config['theme']."""
-        monkeypatch.setenv("BPMN2DRAWIO_THEME", "blueprint")
-        config = get_env_config()
+        config = get_env_config({"BPMN2DRAWIO_THEME": "blueprint"})
         assert config["theme"] == "blueprint"
 
-    def test_layout_env_var(self, monkeypatch):
+    def test_layout_env_var(self):
         """BPMN2DRAWIO_LAYOUT env var populates config['layout']."""
-        monkeypatch.setenv("BPMN2DRAWIO_LAYOUT", "preserve")
-        config = get_env_config()
+        config = get_env_config({"BPMN2DRAWIO_LAYOUT": "preserve"})
         assert config["layout"] == "preserve"
 
-    def test_direction_env_var(self, monkeypatch):
+    def test_direction_env_var(self):
         """BPMN2DRAWIO_DIRECTION env var populates config['direction']."""
-        monkeypatch.setenv("BPMN2DRAWIO_DIRECTION", "vertical")
-        config = get_env_config()
+        config = get_env_config({"BPMN2DRAWIO_DIRECTION": "vertical"})
         assert config["direction"] == "vertical"
 
-    def test_graphviz_path_env_var(self, monkeypatch):
+    def test_graphviz_path_env_var(self):
         """BPMN2DRAWIO_GRAPHVIZ_PATH env var populates config['graphviz_path']."""
-        monkeypatch.setenv("BPMN2DRAWIO_GRAPHVIZ_PATH", "/usr/local/bin/dot")
-        config = get_env_config()
+        config = get_env_config({"BPMN2DRAWIO_GRAPHVIZ_PATH": "/usr/local/bin/dot"})
         assert config["graphviz_path"] == "/usr/local/bin/dot"
 
-    def test_all_env_vars_together(self, monkeypatch):
+    def test_all_env_vars_together(self):
         """All four env vars populate their respective keys."""
-        monkeypatch.setenv("BPMN2DRAWIO_THEME", "monochrome")
-        monkeypatch.setenv("BPMN2DRAWIO_LAYOUT", "auto")
-        monkeypatch.setenv("BPMN2DRAWIO_DIRECTION", "horizontal")
-        monkeypatch.setenv("BPMN2DRAWIO_GRAPHVIZ_PATH", "/opt/graphviz/bin/dot")
-        config = get_env_config()
+        config = get_env_config(
+            {
+                "BPMN2DRAWIO_THEME": "monochrome",
+                "BPMN2DRAWIO_LAYOUT": "auto",
+                "BPMN2DRAWIO_DIRECTION": "horizontal",
+                "BPMN2DRAWIO_GRAPHVIZ_PATH": "/opt/graphviz/bin/dot",
+            }
+        )
         assert len(config) == 4
         assert config["theme"] == "monochrome"
         assert config["layout"] == "auto"
         assert config["direction"] == "horizontal"
         assert config["graphviz_path"] == "/opt/graphviz/bin/dot"
+
+    def test_defaults_to_os_environ(self, monkeypatch):
+        """Without an explicit mapping, os.environ is read."""
+        monkeypatch.setenv("BPMN2DRAWIO_THEME", "blueprint")
+        config = get_env_config()
+        assert config["theme"] == "blueprint"
@@ -42,6 +42,14 @@ class TestConverterBasic:
         assert "Begin" in drawio_xml
         assert "Finish" in drawio_xml
 
+    def test_convert_string_from_path(self):
+        """Test converting a BPMN file path to an in-memory string."""
+        converter = Converter()
+        drawio_xml = converter.convert_string(FIXTURES_DIR / "minimal.bpmn")
+
+        assert drawio_xml.startswith("<?xml")
+        assert "mxfile" in drawio_xml
+
     def test_convert_nonexistent_file(self, tmp_path):
         """Test converting nonexistent file."""
         converter = Converter()
@@ -6,7 +6,6 @@ import xml.etree.ElementTree as ET
 
 from bpmn2drawio.converter import Converter
 from bpmn2drawio.parser import parse_bpmn
-from bpmn2drawio.validation import validate_model
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -266,18 +265,16 @@ class TestEdgeCases:
 class TestValidationIntegration:
     """Tests for validation integration."""
 
-    def test_valid_model_no_errors(self):
+    def test_valid_model_no_errors(self, validated):
         """Test valid model has no validation errors."""
-        model = parse_bpmn(FIXTURES_DIR / "minimal.bpmn")
-        warnings = validate_model(model)
+        warnings = validated(FIXTURES_DIR / "minimal.bpmn")
 
         errors = [w for w in warnings if w.level == "error"]
         assert len(errors) == 0
 
-    def test_invalid_refs_has_errors(self):
+    def test_invalid_refs_has_errors(self, validated):
         """Test invalid refs produces validation errors."""
-        model = parse_bpmn(FIXTURES_DIR / "invalid_refs.bpmn")
-        warnings = validate_model(model)
+        warnings = validated(FIXTURES_DIR / "invalid_refs.bpmn")
 
         errors = [w for w in warnings if w.level == "error"]
         assert len(errors) > 0
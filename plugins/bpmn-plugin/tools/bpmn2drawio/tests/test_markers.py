@@ -1,7 +1,8 @@
 """Tests for gateway markers and task/event icons."""
 
 from pathlib import Path
-from xml.etree import ElementTree as ET
+
+from lxml import etree
 
 from bpmn2drawio.parser import parse_bpmn
 from bpmn2drawio.generator import DrawioGenerator
@@ -12,6 +13,9 @@ from bpmn2drawio.icons import create_task_icon, create_event_icon
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Compiled once; each call runs lxml's C traversal
+VERTEX_CELLS = etree.XPath("//mxCell[@vertex='1']")
+
 
 class TestGatewayMarkers:
     """Tests for gateway marker generation."""
@@ -59,10 +63,10 @@ class TestGatewayMarkers:
         generator = DrawioGenerator()
 
         xml = generator.generate_string(model)
-        root = ET.fromstring(xml.encode())
+        root = etree.fromstring(xml.encode())
 
         # Should have gateway elements plus markers
-        vertices = root.findall(".//mxCell[@vertex='1']")
+        vertices = VERTEX_CELLS(root)
 
         # 7 elements (start + 5 gateways + end) + 5 gateway markers = 12
         # Note: might vary based on marker implementation
@@ -114,9 +118,9 @@ class TestTaskIcons:
         generator = DrawioGenerator()
 
         xml = generator.generate_string(model)
-        root = ET.fromstring(xml.encode())
+        root = etree.fromstring(xml.encode())
 
-        vertices = root.findall(".//mxCell[@vertex='1']")
+        vertices = VERTEX_CELLS(root)
 
         # 10 elements + task icons for 7 specific task types
         assert len(vertices) >= 10
@@ -167,9 +171,9 @@ class TestEventIcons:
         generator = DrawioGenerator()
 
         xml = generator.generate_string(model)
-        root = ET.fromstring(xml.encode())
+        root = etree.fromstring(xml.encode())
 
-        vertices = root.findall(".//mxCell[@vertex='1']")
+        vertices = VERTEX_CELLS(root)
 
         # Should have event elements plus icons for typed events
         assert len(vertices) >= 13
@@ -1,5 +1,9 @@
 """Tests for BPMN data models."""
 
+import copy
+
+import pytest
+
 from bpmn2drawio.models import (
     BPMNElement,
     BPMNFlow,
@@ -54,6 +58,18 @@ class TestBPMNElement:
         )
         assert element.properties["defaultFlow"] == "flow1"
 
+    def test_element_uses_slots(self):
+        """Test elements are slotted and reject unknown attributes."""
+        element = BPMNElement(id="task1", type="task", x=10.0, y=20.0)
+
+        assert not hasattr(element, "__dict__")
+        with pytest.raises(AttributeError):
+            element.colour = "red"
+
+        clone = copy.deepcopy(element)
+        assert clone == element
+        assert clone is not element
+
 
 class TestBPMNFlow:
     """Tests for BPMNFlow dataclass."""
@@ -6,7 +6,11 @@ _avoid_overlap(), _position_boundary_events(), and edge cases.
 """
 
 from bpmn2drawio.models import BPMNElement, BPMNFlow, BPMNModel, Pool, Lane
-from bpmn2drawio.position_resolver import PositionResolver, resolve_positions
+from bpmn2drawio.position_resolver import (
+    PositionResolver,
+    _get_pooled_resolver,
+    resolve_positions,
+)
 from bpmn2drawio.constants import LayoutConstants
 
 
@@ -1128,6 +1132,14 @@ class TestResolvePositionsConvenienceFunction:
         assert t.x is not None
         assert t.y is not None
 
+    def test_resolver_reused_per_configuration(self):
+        """Pooled resolvers are reused for the same direction and layout mode."""
+        first = _get_pooled_resolver("LR", "graphviz")
+        assert _get_pooled_resolver("LR", "graphviz") is first
+        other = _get_pooled_resolver("TB", "graphviz")
+        assert other is not first
+        assert other.layout_engine.direction == "TB"
+
 
 class TestPreserveLanePositions:
     """Tests for _preserve_lane_positions()."""
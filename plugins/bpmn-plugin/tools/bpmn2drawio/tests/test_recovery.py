@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from bpmn2drawio.recovery import RecoveryStrategy, recover_model
+from bpmn2drawio.recovery import GRID_COLUMNS, RecoveryStrategy, recover_model
 from bpmn2drawio.models import BPMNModel, BPMNElement, BPMNFlow
 from bpmn2drawio.parser import parse_bpmn
 
@@ -54,6 +54,16 @@ class TestRecoverMissingCoordinates:
         assert element.width == 36
         assert element.height == 36
 
+    def test_recover_wraps_at_grid_columns(self):
+        """Test grid position wraps to the next row after GRID_COLUMNS columns."""
+        strategy = RecoveryStrategy()
+        element = BPMNElement(id="Task_1", type="task")
+
+        strategy.recover_missing_coordinates(element, index=GRID_COLUMNS)
+
+        assert element.x == 100
+        assert element.y == 200
+
 
 class TestRecoverInvalidParent:
     """Tests for parent recovery."""
@@ -3,9 +3,7 @@
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
-from bpmn2drawio.parser import parse_bpmn
 from bpmn2drawio.generator import DrawioGenerator
-from bpmn2drawio.converter import Converter
 from bpmn2drawio.models import BPMNElement, BPMNFlow
 from bpmn2drawio.routing import EdgeRouter, calculate_edge_routes
 from bpmn2drawio.waypoints import (
@@ -16,8 +14,34 @@ from bpmn2drawio.waypoints import (
 )
 from bpmn2drawio.styles import get_edge_style
 
+from drawio_style_tokens import (
+    DASHED,
+    END_ARROW_BLOCK,
+    END_ARROW_NONE,
+    END_FILL,
+    ORTHOGONAL_EDGE,
+    START_ARROW_DASH,
+    START_ARROW_DIAMOND,
+    START_ARROW_OVAL,
+)
+
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
+CONDITIONAL_FLOWS_BPMN = FIXTURES_DIR / "conditional_flows.bpmn"
+WITH_DI_BPMN = FIXTURES_DIR / "with_di.bpmn"
+
+# Shared geometry; routing and waypoint generation never mutate elements
+_START = BPMNElement(id="start", type="startEvent", x=100, y=100, width=36, height=36)
+_TASK_RIGHT = BPMNElement(id="task", type="task", x=200, y=80, width=120, height=80)
+_TASK_BELOW = BPMNElement(id="task", type="task", x=80, y=250, width=120, height=80)
+_TASK_FAR_RIGHT = BPMNElement(id="task", type="task", x=300, y=100, width=120, height=80)
+_END = BPMNElement(id="end", type="endEvent", x=400, y=100, width=36, height=36)
+
+_LINEAR_ELEMENTS = (_START, _TASK_RIGHT, _END)
+_LINEAR_FLOWS = (
+    BPMNFlow(id="f1", type="sequenceFlow", source_ref="start", target_ref="task"),
+    BPMNFlow(id="f2", type="sequenceFlow", source_ref="task", target_ref="end"),
+)
 
 
 class TestEdgeRouter:
@@ -25,13 +49,7 @@ class TestEdgeRouter:
 
     def test_route_horizontal(self):
         """Test routing between horizontally adjacent elements."""
-        elements = [
-            BPMNElement(
-                id="start", type="startEvent", x=100, y=100, width=36, height=36
-            ),
-            BPMNElement(id="task", type="task", x=200, y=80, width=120, height=80),
-        ]
-        router = EdgeRouter(elements)
+        router = EdgeRouter((_START, _TASK_RIGHT))
 
         waypoints = router.route("start", "task")
 
@@ -43,13 +61,7 @@ class TestEdgeRouter:
 
     def test_route_vertical(self):
         """Test routing between vertically adjacent elements."""
-        elements = [
-            BPMNElement(
-                id="start", type="startEvent", x=100, y=100, width=36, height=36
-            ),
-            BPMNElement(id="task", type="task", x=80, y=250, width=120, height=80),
-        ]
-        router = EdgeRouter(elements)
+        router = EdgeRouter((_START, _TASK_BELOW))
 
         waypoints = router.route("start", "task")
 
@@ -57,19 +69,25 @@ class TestEdgeRouter:
 
     def test_route_preserves_existing_waypoints(self):
         """Test that existing waypoints are preserved."""
-        elements = [
-            BPMNElement(
-                id="start", type="startEvent", x=100, y=100, width=36, height=36
-            ),
-            BPMNElement(id="task", type="task", x=300, y=100, width=120, height=80),
-        ]
-        router = EdgeRouter(elements)
+        router = EdgeRouter((_START, _TASK_FAR_RIGHT))
         existing = [(136, 118), (200, 118), (300, 140)]
 
         waypoints = router.route("start", "task", existing)
 
         assert waypoints == existing
 
+    def test_route_follows_moved_element(self):
+        """Test that routes use element positions at route time."""
+        start = BPMNElement(id="start", type="startEvent", x=100, y=100, width=36, height=36)
+        task = BPMNElement(id="task", type="task", x=300, y=100, width=120, height=80)
+        router = EdgeRouter((start, task))
+
+        task.x, task.y = 58, 300
+        waypoints = router.route("start", "task")
+
+        assert waypoints[0] == (118, 136)
+        assert waypoints[-1] == (118, 300)
+
 
 class TestWaypointConversion:
     """Tests for waypoint conversion functions."""
@@ -88,14 +106,19 @@ class TestWaypointConversion:
         assert result[0] == (100.0, 118.0)
         assert result[2] == (300.0, 118.0)
 
+    def test_convert_bpmn_waypoints_bulk(self):
+        """Test converting a large DI waypoint list keeps every point exact."""
+        di_waypoints = [{"x": str(i), "y": str(i + 1)} for i in range(10000)]
+
+        result = convert_bpmn_waypoints(di_waypoints)
+
+        assert len(result) == 10000
+        assert result[0] == (0.0, 1.0)
+        assert result[-1] == (9999.0, 10000.0)
+
     def test_generate_waypoints_horizontal(self):
         """Test generating waypoints for horizontal flow."""
-        source = BPMNElement(
-            id="s", type="startEvent", x=100, y=100, width=36, height=36
-        )
-        target = BPMNElement(id="t", type="task", x=300, y=80, width=120, height=80)
-
-        waypoints = generate_waypoints(source, target)
+        waypoints = generate_waypoints(_START, _TASK_FAR_RIGHT)
 
         assert len(waypoints) >= 2
 
@@ -147,51 +170,45 @@ class TestEdgeLabelPosition:
 class TestEdgeStyles:
     """Tests for edge style generation."""
 
-    def test_sequence_flow_style(self):
+    def test_sequence_flow_style(self, style_tokens):
         """Test sequence flow has correct style."""
-        style = get_edge_style("sequenceFlow")
+        tokens = style_tokens(get_edge_style("sequenceFlow"))
 
-        assert "orthogonalEdgeStyle" in style
-        assert "endArrow=block" in style
-        assert "endFill=1" in style
+        assert {ORTHOGONAL_EDGE, END_ARROW_BLOCK, END_FILL} <= tokens
 
     def test_default_flow_style(self):
         """Test default flow has slash marker."""
         style = get_edge_style("sequenceFlow", is_default=True)
 
-        assert "startArrow=dash" in style
+        assert START_ARROW_DASH in style
 
     def test_conditional_flow_style(self):
         """Test conditional flow has diamond marker."""
         style = get_edge_style("sequenceFlow", has_condition=True)
 
-        assert "startArrow=diamond" in style
+        assert START_ARROW_DIAMOND in style
 
-    def test_message_flow_style(self):
+    def test_message_flow_style(self, style_tokens):
         """Test message flow is dashed."""
-        style = get_edge_style("messageFlow")
+        tokens = style_tokens(get_edge_style("messageFlow"))
 
-        assert "dashed=1" in style
-        assert "startArrow=oval" in style
+        assert {DASHED, START_ARROW_OVAL} <= tokens
 
-    def test_association_style(self):
+    def test_association_style(self, style_tokens):
         """Test association has dotted line."""
-        style = get_edge_style("association")
+        tokens = style_tokens(get_edge_style("association"))
 
-        assert "dashed=1" in style
-        assert "endArrow=none" in style
+        assert {DASHED, END_ARROW_NONE} <= tokens
 
 
 class TestConditionalFlowFile:
     """Tests for conditional flow BPMN file."""
 
-    def test_parse_conditional_flows(self):
+    def test_parse_conditional_flows(self, conditional_model):
         """Test parsing conditional flows."""
-        model = parse_bpmn(FIXTURES_DIR / "conditional_flows.bpmn")
-
         # Find conditional flow
         conditional_flow = None
-        for flow in model.flows:
+        for flow in conditional_model.flows:
             if flow.condition:
                 conditional_flow = flow
                 break
@@ -199,35 +216,38 @@ class TestConditionalFlowFile:
         assert conditional_flow is not None
         assert "status" in conditional_flow.condition
 
-    def test_parse_default_flow(self):
+    def test_parse_default_flow(self, conditional_model):
         """Test parsing default flow."""
-        model = parse_bpmn(FIXTURES_DIR / "conditional_flows.bpmn")
-
-        default_flow = model.get_flow_by_id("Flow_Default")
+        default_flow = conditional_model.get_flow_by_id("Flow_Default")
         assert default_flow is not None
         assert default_flow.is_default
 
-    def test_generate_conditional_flows(self):
+    def test_generate_conditional_flows(self, conditional_model):
         """Test generating diagram with conditional flows."""
-        model = parse_bpmn(FIXTURES_DIR / "conditional_flows.bpmn")
         generator = DrawioGenerator()
 
-        xml = generator.generate_string(model)
-        root = ET.fromstring(xml.encode())
+        xml = generator.generate_string(conditional_model)
 
-        edges = root.findall(".//mxCell[@edge='1']")
-        assert len(edges) >= 7
-
-        # Check for conditional and default flow styles
+        # Stream edge cells from the str output in 4 KB chunks; no encode step
+        # and no materialized tree
+        parser = ET.XMLPullParser(events=("end",))
+        edge_count = 0
         has_conditional = False
         has_default = False
-        for edge in edges:
-            style = edge.get("style", "")
-            if "startArrow=diamond" in style:
-                has_conditional = True
-            if "startArrow=dash" in style:
-                has_default = True
-
+        for offset in range(0, len(xml), 4096):
+            parser.feed(xml[offset : offset + 4096])
+            for _, elem in parser.read_events():
+                if elem.tag == "mxCell" and elem.get("edge") == "1":
+                    edge_count += 1
+                    style = elem.get("style", "")
+                    if START_ARROW_DIAMOND in style:
+                        has_conditional = True
+                    if START_ARROW_DASH in style:
+                        has_default = True
+                elem.clear()
+        parser.close()
+
+        assert edge_count >= 7
         assert has_conditional or has_default  # At least one special flow
 
 
@@ -236,49 +256,60 @@ class TestEdgeRouteCalculation:
 
     def test_calculate_all_routes(self):
         """Test calculating routes for all flows."""
+        routes = calculate_edge_routes(_LINEAR_ELEMENTS, _LINEAR_FLOWS)
+
+        assert "f1" in routes
+        assert "f2" in routes
+        assert len(routes["f1"]) >= 2
+
+    def test_calculate_routes_large_diagram(self):
+        """Test routing a large diagram routes every flow."""
         elements = [
             BPMNElement(
-                id="start", type="startEvent", x=100, y=100, width=36, height=36
-            ),
-            BPMNElement(id="task", type="task", x=200, y=80, width=120, height=80),
-            BPMNElement(id="end", type="endEvent", x=400, y=100, width=36, height=36),
+                id=f"task_{i}",
+                type="task",
+                x=(i % 25) * 160,
+                y=(i // 25) * 120,
+                width=120,
+                height=80,
+            )
+            for i in range(500)
         ]
         flows = [
             BPMNFlow(
-                id="f1", type="sequenceFlow", source_ref="start", target_ref="task"
-            ),
-            BPMNFlow(id="f2", type="sequenceFlow", source_ref="task", target_ref="end"),
+                id=f"flow_{i}",
+                type="sequenceFlow",
+                source_ref=f"task_{i}",
+                target_ref=f"task_{(i * 7 + 1) % 500}",
+            )
+            for i in range(500)
         ]
 
         routes = calculate_edge_routes(elements, flows)
 
-        assert "f1" in routes
-        assert "f2" in routes
-        assert len(routes["f1"]) >= 2
+        assert len(routes) == 500
+        assert all(len(waypoints) >= 2 for waypoints in routes.values())
 
 
 class TestEndToEndRouting:
     """End-to-end tests for edge routing."""
 
-    def test_convert_with_routing(self, tmp_path):
+    def test_convert_with_routing(self, tmp_path, converter):
         """Test conversion includes proper routing."""
-        converter = Converter()
         output_file = tmp_path / "conditional.drawio"
 
-        result = converter.convert(FIXTURES_DIR / "conditional_flows.bpmn", output_file)
+        result = converter.convert(CONDITIONAL_FLOWS_BPMN, output_file)
 
         assert result.success
         assert result.flow_count >= 7
 
-    def test_di_waypoints_preserved(self, tmp_path):
+    def test_di_waypoints_preserved(self, tmp_path, converter):
         """Test DI waypoints are preserved in output."""
-        converter = Converter()
         output_file = tmp_path / "with_di.drawio"
 
-        result = converter.convert(FIXTURES_DIR / "with_di.bpmn", output_file)
+        result = converter.convert(WITH_DI_BPMN, output_file)
 
         assert result.success
 
-        content = output_file.read_text()
-        # Should contain edge elements
-        assert 'edge="1"' in content
+        # Should contain edge elements; probe the raw bytes, no decode needed
+        assert b'edge="1"' in output_file.read_bytes()
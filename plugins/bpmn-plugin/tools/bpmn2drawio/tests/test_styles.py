@@ -1,5 +1,9 @@
 """Tests for Draw.io style mappings and style generation functions."""
 
+import itertools
+
+import pytest
+
 from bpmn2drawio.styles import (
     STYLE_MAP,
     EDGE_STYLES,
@@ -9,6 +13,51 @@ from bpmn2drawio.styles import (
 )
 from bpmn2drawio.themes import BPMNTheme, get_theme
 
+from drawio_style_tokens import (
+    DASHED,
+    ELLIPSE,
+    END_ARROW_BLOCK,
+    END_ARROW_NONE,
+    END_FILL,
+    HTML,
+    ORTHOGONAL_EDGE,
+    RHOMBUS,
+    ROUNDED,
+    START_ARROW_DASH,
+    START_ARROW_DIAMOND,
+    START_ARROW_OVAL,
+    START_FILL_OPEN,
+)
+
+
+ALL_STYLE_ITEMS = list(STYLE_MAP.items())
+
+# Every get_edge_style argument combination, including unknown flow types
+ALL_EDGE_STYLE_ARGS = list(
+    itertools.product([*EDGE_STYLES, "unknownFlowType", ""], (False, True), (False, True))
+)
+
+EXPECTED_SHAPES = [
+    ("startEvent", ELLIPSE),
+    ("endEvent", ELLIPSE),
+    ("intermediateCatchEvent", ELLIPSE),
+    ("intermediateThrowEvent", ELLIPSE),
+    ("boundaryEvent", ELLIPSE),
+    ("task", ROUNDED),
+    ("userTask", ROUNDED),
+    ("serviceTask", ROUNDED),
+    ("scriptTask", ROUNDED),
+    ("sendTask", ROUNDED),
+    ("receiveTask", ROUNDED),
+    ("businessRuleTask", ROUNDED),
+    ("manualTask", ROUNDED),
+    ("exclusiveGateway", RHOMBUS),
+    ("parallelGateway", RHOMBUS),
+    ("inclusiveGateway", RHOMBUS),
+    ("eventBasedGateway", RHOMBUS),
+    ("complexGateway", RHOMBUS),
+]
+
 
 class TestStyleMapDefinitions:
     """Tests for STYLE_MAP dictionary completeness and structure."""
@@ -44,67 +93,25 @@ class TestStyleMapDefinitions:
 
     def test_all_expected_element_types_in_style_map(self):
         """All standard BPMN element types have style mappings."""
-        for elem_type in self.EXPECTED_ELEMENT_TYPES:
-            assert elem_type in STYLE_MAP, f"Missing style for {elem_type}"
-
-    def test_style_values_are_nonempty_strings(self):
-        """All style values are non-empty strings."""
-        for elem_type, style in STYLE_MAP.items():
-            assert isinstance(style, str), f"{elem_type} style is not a string"
-            assert len(style) > 0, f"{elem_type} style is empty"
-
-    def test_style_strings_end_with_semicolon(self):
-        """All style strings end with a semicolon (Draw.io convention)."""
-        for elem_type, style in STYLE_MAP.items():
-            assert style.endswith(";"), (
-                f"{elem_type} style does not end with semicolon: {style[-20:]}"
-            )
-
-    def test_style_strings_contain_html_flag(self):
-        """All element styles include html=1 for Draw.io rendering."""
-        for elem_type, style in STYLE_MAP.items():
-            assert "html=1" in style, f"{elem_type} missing html=1"
-
-    def test_events_use_ellipse_shape(self):
-        """Event element types use ellipse shape."""
-        event_types = [
-            "startEvent",
-            "endEvent",
-            "intermediateCatchEvent",
-            "intermediateThrowEvent",
-            "boundaryEvent",
-        ]
-        for event_type in event_types:
-            assert "ellipse" in STYLE_MAP[event_type], (
-                f"{event_type} missing ellipse shape"
-            )
-
-    def test_tasks_use_rounded_shape(self):
-        """Task element types use rounded rectangle shape."""
-        task_types = [
-            "task",
-            "userTask",
-            "serviceTask",
-            "scriptTask",
-            "sendTask",
-            "receiveTask",
-            "businessRuleTask",
-            "manualTask",
-        ]
-        for task_type in task_types:
-            assert "rounded=1" in STYLE_MAP[task_type], f"{task_type} missing rounded=1"
-
-    def test_gateways_use_rhombus_shape(self):
-        """Gateway element types use rhombus shape."""
-        gw_types = [
-            "exclusiveGateway",
-            "parallelGateway",
-            "inclusiveGateway",
-            "eventBasedGateway",
-            "complexGateway",
-        ]
-        for gw_type in gw_types:
-            assert "rhombus" in STYLE_MAP[gw_type], f"{gw_type} missing rhombus shape"
+        missing = set(self.EXPECTED_ELEMENT_TYPES) - STYLE_MAP.keys()
+        assert not missing, f"Missing styles for {sorted(missing)}"
+
+    @pytest.mark.parametrize("elem_type,style", ALL_STYLE_ITEMS)
+    def test_style_string_well_formed(self, elem_type, style):
+        """Each style is a non-empty string ending in ';' with html=1 set."""
+        assert isinstance(style, str), f"{elem_type} style is not a string"
+        assert len(style) > 0, f"{elem_type} style is empty"
+        assert style.endswith(";"), (
+            f"{elem_type} style does not end with semicolon: {style[-20:]}"
+        )
+        assert HTML in style, f"{elem_type} missing html=1"
+
+    @pytest.mark.parametrize("elem_type,expected_shape", EXPECTED_SHAPES)
+    def test_element_uses_expected_shape(self, elem_type, expected_shape):
+        """Events use ellipses, tasks rounded rectangles, gateways rhombi."""
+        assert expected_shape in STYLE_MAP[elem_type], (
+            f"{elem_type} missing {expected_shape}"
+        )
 
     def test_end_event_has_thick_stroke(self):
         """End event has strokeWidth=3 for visual distinction."""
@@ -147,26 +154,24 @@ class TestEdgeStyleDefinitions:
             assert isinstance(style, str), f"{flow_type} edge style is not a string"
             assert len(style) > 0, f"{flow_type} edge style is empty"
 
-    def test_sequence_flow_has_filled_arrow(self):
+    def test_sequence_flow_has_filled_arrow(self, style_tokens):
         """Sequence flow has filled block arrow."""
-        style = EDGE_STYLES["sequenceFlow"]
-        assert "endArrow=block" in style
-        assert "endFill=1" in style
+        assert {END_ARROW_BLOCK, END_FILL} <= style_tokens(EDGE_STYLES["sequenceFlow"])
 
     def test_message_flow_is_dashed(self):
         """Message flow uses dashed line style."""
         style = EDGE_STYLES["messageFlow"]
-        assert "dashed=1" in style
+        assert DASHED in style
 
     def test_association_has_no_end_arrow(self):
         """Association flow has no arrow head."""
         style = EDGE_STYLES["association"]
-        assert "endArrow=none" in style
+        assert END_ARROW_NONE in style
 
-    def test_all_edge_styles_use_orthogonal_routing(self):
+    def test_all_edge_styles_use_orthogonal_routing(self, style_tokens):
         """All edge styles use orthogonal edge routing."""
         for flow_type, style in EDGE_STYLES.items():
-            assert "orthogonalEdgeStyle" in style, (
+            assert ORTHOGONAL_EDGE in style_tokens(style), (
                 f"{flow_type} missing orthogonal routing"
             )
 
@@ -190,10 +195,10 @@ class TestSwimlaneStyleDefinitions:
         """Pool style uses horizontal=0 (horizontal swimlane orientation)."""
         assert "horizontal=0" in SWIMLANE_STYLES["pool"]
 
-    def test_swimlanes_are_not_collapsible(self):
+    def test_swimlanes_are_not_collapsible(self, style_tokens):
         """Pool and lane styles are not collapsible."""
-        assert "collapsible=0" in SWIMLANE_STYLES["pool"]
-        assert "collapsible=0" in SWIMLANE_STYLES["lane"]
+        for key in ("pool", "lane"):
+            assert "collapsible=0" in style_tokens(SWIMLANE_STYLES[key])
 
     def test_swimlane_styles_contain_swimlane_flag(self):
         """All swimlane styles include the swimlane shape type."""
@@ -231,57 +236,106 @@ class TestGetElementStyle:
 class TestGetEdgeStyle:
     """Tests for get_edge_style function."""
 
-    def test_sequence_flow_basic(self):
-        """Basic sequence flow returns standard style."""
-        style = get_edge_style("sequenceFlow")
-        assert style == EDGE_STYLES["sequenceFlow"]
-
-    def test_message_flow_returns_dashed_style(self):
-        """Message flow returns its dashed line style."""
-        style = get_edge_style("messageFlow")
-        assert style == EDGE_STYLES["messageFlow"]
-        assert "dashed=1" in style
-
-    def test_unknown_flow_type_falls_back_to_sequence_flow(self):
-        """Unknown flow type defaults to sequence flow style."""
-        style = get_edge_style("unknownFlowType")
-        assert style == EDGE_STYLES["sequenceFlow"]
-
-    def test_default_flow_adds_slash_marker(self):
-        """Default sequence flow adds startArrow=dash marker."""
-        style = get_edge_style("sequenceFlow", is_default=True)
-        assert "startArrow=dash" in style
-        assert "startFill=0" in style
-        assert "endArrow=block" in style
-
-    def test_conditional_flow_adds_diamond_marker(self):
-        """Conditional sequence flow adds startArrow=diamond marker."""
-        style = get_edge_style("sequenceFlow", has_condition=True)
-        assert "startArrow=diamond" in style
-        assert "startFill=0" in style
-        assert "endArrow=block" in style
-
-    def test_default_takes_precedence_over_condition(self):
-        """When both is_default and has_condition are True, default marker wins."""
-        style = get_edge_style("sequenceFlow", is_default=True, has_condition=True)
-        assert "startArrow=dash" in style
-        assert "startArrow=diamond" not in style
-
-    def test_default_flag_only_affects_sequence_flow(self):
-        """is_default flag does not modify non-sequence flow styles."""
-        style = get_edge_style("messageFlow", is_default=True)
-        # Should be unchanged from base messageFlow style
-        assert style == EDGE_STYLES["messageFlow"]
-
-    def test_condition_flag_only_affects_sequence_flow(self):
-        """has_condition flag does not modify non-sequence flow styles."""
-        style = get_edge_style("association", has_condition=True)
-        assert style == EDGE_STYLES["association"]
+    # (flow_type, kwargs, expected base style key)
+    BASE_STYLE_CASES = [
+        pytest.param("sequenceFlow", {}, "sequenceFlow", id="sequence-basic"),
+        pytest.param("messageFlow", {}, "messageFlow", id="message-basic"),
+        pytest.param("unknownFlowType", {}, "sequenceFlow", id="unknown-falls-back"),
+        pytest.param(
+            "messageFlow",
+            {"is_default": True},
+            "messageFlow",
+            id="message-ignores-default",
+        ),
+        pytest.param(
+            "association",
+            {"has_condition": True},
+            "association",
+            id="association-ignores-condition",
+        ),
+    ]
+
+    # (flow_type, kwargs, required style tokens, forbidden style tokens)
+    MARKER_CASES = [
+        pytest.param(
+            "sequenceFlow",
+            {},
+            {ORTHOGONAL_EDGE, END_ARROW_BLOCK, END_FILL},
+            {START_ARROW_DASH, START_ARROW_DIAMOND},
+            id="sequence-plain",
+        ),
+        pytest.param(
+            "sequenceFlow",
+            {"is_default": True},
+            {START_ARROW_DASH, START_FILL_OPEN, END_ARROW_BLOCK},
+            {START_ARROW_DIAMOND},
+            id="default-slash-marker",
+        ),
+        pytest.param(
+            "sequenceFlow",
+            {"has_condition": True},
+            {START_ARROW_DIAMOND, START_FILL_OPEN, END_ARROW_BLOCK},
+            {START_ARROW_DASH},
+            id="conditional-diamond-marker",
+        ),
+        pytest.param(
+            "sequenceFlow",
+            {"is_default": True, "has_condition": True},
+            {START_ARROW_DASH},
+            {START_ARROW_DIAMOND},
+            id="default-wins-over-condition",
+        ),
+        pytest.param(
+            "messageFlow",
+            {"is_default": True},
+            {DASHED, START_ARROW_OVAL},
+            {START_ARROW_DASH},
+            id="message-dashed",
+        ),
+    ]
+
+    @pytest.mark.parametrize("flow_type,kwargs,base_key", BASE_STYLE_CASES)
+    def test_returns_base_style(self, flow_type, kwargs, base_key):
+        """Flows without applicable markers return the base EDGE_STYLES entry."""
+        assert get_edge_style(flow_type, **kwargs) == EDGE_STYLES[base_key]
+
+    @pytest.mark.parametrize("flow_type,kwargs,required,forbidden", MARKER_CASES)
+    def test_marker_tokens(self, flow_type, kwargs, required, forbidden, style_tokens):
+        """Default/conditional markers are added only where they apply."""
+        tokens = style_tokens(get_edge_style(flow_type, **kwargs))
+        assert required <= tokens, f"missing {sorted(required - tokens)}"
+        assert forbidden.isdisjoint(tokens), f"unexpected {sorted(forbidden & tokens)}"
 
     def test_plain_sequence_flow_has_no_start_arrow(self):
         """Basic sequence flow (not default, not conditional) has no start arrow marker."""
-        style = get_edge_style("sequenceFlow")
-        assert "startArrow=" not in style
+        assert "startArrow=" not in get_edge_style("sequenceFlow")
+
+    @pytest.mark.parametrize("flow_type,is_default,has_condition", ALL_EDGE_STYLE_ARGS)
+    def test_marker_invariants(self, flow_type, is_default, has_condition, style_tokens):
+        """Markers appear only on sequence flows, and default wins over condition."""
+        tokens = style_tokens(get_edge_style(flow_type, is_default, has_condition))
+        is_sequence = flow_type == "sequenceFlow"
+
+        assert (START_ARROW_DASH in tokens) == (is_sequence and is_default)
+        assert (START_ARROW_DIAMOND in tokens) == (is_sequence and has_condition and not is_default)
+
+    @pytest.mark.parametrize("flow_type,is_default,has_condition", ALL_EDGE_STYLE_ARGS)
+    def test_keeps_base_tokens(self, flow_type, is_default, has_condition, style_tokens):
+        """Marker handling only adds tokens to the (possibly fallback) base style."""
+        base = EDGE_STYLES.get(flow_type, EDGE_STYLES["sequenceFlow"])
+        style = get_edge_style(flow_type, is_default=is_default, has_condition=has_condition)
+
+        assert style_tokens(base) <= style_tokens(style)
+
+
+class TestStyleMemoization:
+    """Tests for precomputed style lookups."""
+
+    def test_get_edge_style_served_from_table(self):
+        """Edge styles come from the precomputed table, not rebuilt per call."""
+        first = get_edge_style("sequenceFlow", is_default=True)
+        second = get_edge_style("sequenceFlow", is_default=True)
+        assert first is second
 
 
 class TestThemeStyleIntegration:
@@ -326,7 +380,7 @@ class TestThemeStyleIntegration:
         """Theme generates gateway styles with rhombus shape."""
         theme = BPMNTheme()
         style = theme.style_for("exclusiveGateway")
-        assert "rhombus" in style
+        assert RHOMBUS in style
 
     def test_theme_unknown_type_falls_back_to_task(self):
         """Theme style_for with unknown type falls back to task style."""
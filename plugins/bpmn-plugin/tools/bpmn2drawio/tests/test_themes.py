@@ -70,19 +70,20 @@ class TestPredefinedThemes:
         """Test default theme exists."""
         assert "default" in THEMES
 
-    def test_blueprint_theme(self):
-        """Test blueprint theme has blue colors."""
-        theme = THEMES["blueprint"]
-
-        assert "#1976d2" in theme.start_event_stroke
-        assert "#1976d2" in theme.task_stroke
-
-    def test_monochrome_theme(self):
-        """Test monochrome theme has grayscale colors."""
-        theme = THEMES["monochrome"]
-
-        assert theme.start_event_fill == "#ffffff"
-        assert "#333333" in theme.start_event_stroke
+    @pytest.mark.parametrize(
+        "name, attr, expected",
+        [
+            # Blueprint uses blue strokes
+            ("blueprint", "start_event_stroke", "#1976d2"),
+            ("blueprint", "task_stroke", "#1976d2"),
+            # Monochrome uses grayscale colors
+            ("monochrome", "start_event_fill", "#ffffff"),
+            ("monochrome", "start_event_stroke", "#333333"),
+        ],
+    )
+    def test_theme_colors(self, name, attr, expected):
+        """Test predefined themes use their characteristic colors."""
+        assert getattr(THEMES[name], attr) == expected
 
     def test_high_contrast_theme(self):
         """Test high contrast theme has distinct colors."""
@@ -151,24 +152,19 @@ class TestMergeThemeWithConfig:
 class TestEnvConfig:
     """Tests for environment configuration."""
 
-    def test_get_env_config_empty(self, monkeypatch):
+    def test_get_env_config_empty(self):
         """Test empty environment returns empty config."""
-        # Clear relevant env vars
-        monkeypatch.delenv("BPMN2DRAWIO_THEME", raising=False)
-        monkeypatch.delenv("BPMN2DRAWIO_LAYOUT", raising=False)
-
-        config = get_env_config()
+        config = get_env_config({})
 
         # Should return empty dict or dict without those keys
         assert config.get("theme") is None
         assert config.get("layout") is None
 
-    def test_get_env_config_with_vars(self, monkeypatch):
+    def test_get_env_config_with_vars(self):
         """Test environment variables are read."""
-        monkeypatch.setenv("BPMN2DRAWIO_THEME", "blueprint")
-        monkeypatch.setenv("BPMN2DRAWIO_LAYOUT", "preserve")
-
-        config = get_env_config()
+        config = get_env_config(
+            {"BPMN2DRAWIO_THEME": "blueprint", "BPMN2DRAWIO_LAYOUT": "preserve"}
+        )
 
         assert config["theme"] == "blueprint"
         assert config["layout"] == "preserve"
@@ -2,9 +2,8 @@
 
 from pathlib import Path
 
-from bpmn2drawio.validation import ModelValidator, ValidationWarning, validate_model
+from bpmn2drawio.validation import ModelValidator, ValidationWarning
 from bpmn2drawio.models import BPMNModel, BPMNElement, BPMNFlow
-from bpmn2drawio.parser import parse_bpmn
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -167,6 +166,32 @@ class TestReferenceValidation:
         assert warnings[0].level == "error"
         assert "invalid target" in warnings[0].message.lower()
 
+    def test_precomputed_element_ids_used(self):
+        """Test a precomputed element id set is used instead of rescanning."""
+        model = BPMNModel(
+            elements=[
+                BPMNElement(id="Start_1", type="startEvent"),
+                BPMNElement(id="Task_1", type="task"),
+            ],
+            flows=[
+                BPMNFlow(
+                    id="Flow_1",
+                    type="sequenceFlow",
+                    source_ref="Start_1",
+                    target_ref="Task_1",
+                ),
+            ],
+            pools=[],
+            lanes=[],
+            has_di_coordinates=False,
+        )
+
+        validator = ModelValidator()
+        warnings = validator._check_valid_references(model, {"Start_1"})
+
+        assert len(warnings) == 1
+        assert "invalid target" in warnings[0].message.lower()
+
 
 class TestConnectedGraphValidation:
     """Tests for connected graph validation."""
@@ -279,6 +304,32 @@ class TestOverlappingValidation:
         assert warnings[0].level == "warning"
         assert "overlaps" in warnings[0].message.lower()
 
+    def test_overlaps_reported_in_document_order(self):
+        """Test overlaps are reported pairwise in element order, not x order."""
+        model = BPMNModel(
+            elements=[
+                BPMNElement(id="E1", type="task", x=300, y=0, width=100, height=80),
+                BPMNElement(id="E2", type="task", x=0, y=0, width=100, height=80),
+                BPMNElement(id="E3", type="task", x=50, y=40, width=300, height=80),
+                BPMNElement(id="E4", type="task", x=100, y=0, width=100, height=80),
+            ],
+            flows=[],
+            pools=[],
+            lanes=[],
+            has_di_coordinates=True,
+        )
+
+        validator = ModelValidator()
+        warnings = validator._check_overlapping_elements(model)
+
+        # E4 starts exactly where E2 ends, which is not an overlap
+        assert [w.message for w in warnings] == [
+            "Element 'E1' overlaps with 'E3'",
+            "Element 'E2' overlaps with 'E3'",
+            "Element 'E3' overlaps with 'E4'",
+        ]
+        assert [w.element_id for w in warnings] == ["E1", "E2", "E3"]
+
 
 class TestMissingLabelValidation:
     """Tests for missing label detection."""
@@ -340,27 +391,24 @@ class TestMissingLabelValidation:
 class TestValidateModelFunction:
     """Tests for validate_model convenience function."""
 
-    def test_validate_minimal_file(self):
+    def test_validate_minimal_file(self, validated):
         """Test validating minimal BPMN file."""
-        model = parse_bpmn(FIXTURES_DIR / "minimal.bpmn")
-        warnings = validate_model(model)
+        warnings = validated(FIXTURES_DIR / "minimal.bpmn")
 
         # Minimal should be valid with no errors
         errors = [w for w in warnings if w.level == "error"]
         assert len(errors) == 0
 
-    def test_validate_invalid_refs_file(self):
+    def test_validate_invalid_refs_file(self, validated):
         """Test validating file with invalid references."""
-        model = parse_bpmn(FIXTURES_DIR / "invalid_refs.bpmn")
-        warnings = validate_model(model)
+        warnings = validated(FIXTURES_DIR / "invalid_refs.bpmn")
 
         errors = [w for w in warnings if w.level == "error"]
         assert len(errors) == 2  # Two invalid flows
 
-    def test_validate_disconnected_file(self):
+    def test_validate_disconnected_file(self, validated):
         """Test validating file with disconnected elements."""
-        model = parse_bpmn(FIXTURES_DIR / "disconnected.bpmn")
-        warnings = validate_model(model)
+        warnings = validated(FIXTURES_DIR / "disconnected.bpmn")
 
         info_warnings = [w for w in warnings if w.level == "info"]
         # Should have warnings about disconnected elements
@@ -1,7 +1,12 @@
 """Characterization tests for waypoint calculation and conversion."""
 
+from xml.etree import ElementTree as ET
+
+import pytest
+
 from bpmn2drawio.models import BPMNElement, BPMNFlow
 from bpmn2drawio.waypoints import (
+    clear_waypoint_cache,
     convert_bpmn_waypoints,
     generate_waypoints,
     create_waypoint_array,
@@ -32,6 +37,14 @@ def _flow(name=None, **kw) -> BPMNFlow:
     )
 
 
+# Canonical same-row pairs, target to the right of source. generate_waypoints
+# does not modify its inputs, so tests can share these.
+SRC_H = _el("s", x=100, y=200, w=120, h=80)
+TGT_H = _el("t", x=300, y=200, w=120, h=80)
+SRC_H_SMALL = _el("s", x=0, y=100, w=100, h=60)
+TGT_H_SMALL = _el("t", x=200, y=100, w=100, h=60)
+
+
 # ===================================================================
 # 1. Straight horizontal path between adjacent elements
 # ===================================================================
@@ -40,32 +53,25 @@ def _flow(name=None, **kw) -> BPMNFlow:
 class TestStraightHorizontalPath:
     """Elements at the same y, target to the right of source."""
 
-    def test_horizontal_adjacent_waypoints(self):
-        """Two tasks side by side, same row -- path should be horizontal."""
-        source = _el("s", x=100, y=200, w=120, h=80)
-        target = _el("t", x=300, y=200, w=120, h=80)
-
-        wps = generate_waypoints(source, target)
-
-        # Source center: (160, 240), Target center: (360, 240)
-        # tgt_x(360) > src_x(160) + half_w(60) => exit right edge: (220, 240)
-        # src_x(160) < tgt_x(360) - half_w(60) => enter left edge: (300, 240)
-        # |220-300|=80 > 10, |240-240|=0 <= 10 => NO intermediate bend
-        assert wps[0] == (220, 240)  # right edge of source
-        assert wps[-1] == (300, 240)  # left edge of target
-        assert len(wps) == 2  # straight line, no bends
-
-    def test_horizontal_adjacent_left_to_right(self):
-        """Verify horizontal path is purely along x axis."""
-        source = _el("s", x=0, y=100, w=100, h=60)
-        target = _el("t", x=200, y=100, w=100, h=60)
-
+    @pytest.mark.parametrize(
+        "source, target, expected",
+        [
+            # Source center: (160, 240), Target center: (360, 240)
+            # tgt_x(360) > src_x(160) + half_w(60) => exit right edge: (220, 240)
+            # src_x(160) < tgt_x(360) - half_w(60) => enter left edge: (300, 240)
+            # |220-300|=80 > 10, |240-240|=0 <= 10 => NO intermediate bend
+            pytest.param(SRC_H, TGT_H, [(220, 240), (300, 240)], id="task-120x80"),
+            # src center: (50, 130), tgt center: (250, 130)
+            # exit right: (100, 130), enter left: (200, 130)
+            # |100-200|=100 > 10, |130-130|=0 <= 10 => no bend
+            pytest.param(SRC_H_SMALL, TGT_H_SMALL, [(100, 130), (200, 130)], id="task-100x60"),
+        ],
+    )
+    def test_horizontal_adjacent_waypoints(self, source, target, expected):
+        """Two tasks side by side, same row -- path is a straight horizontal line."""
         wps = generate_waypoints(source, target)
 
-        # src center: (50, 130), tgt center: (250, 130)
-        # exit right: (100, 130), enter left: (200, 130)
-        # |100-200|=100 > 10, |130-130|=0 <= 10 => no bend
-        assert len(wps) == 2
+        assert wps == expected  # right edge of source to left edge of target
         assert wps[0][1] == wps[1][1]  # same y => horizontal
 
 
@@ -280,6 +286,22 @@ class TestSelfLoopPath:
         assert wps[0] == (260, 240)  # center
         assert wps[1] == (260, 240)  # same center
 
+    @pytest.mark.parametrize("routing_style", ["orthogonal", "direct"])
+    def test_self_loop_shares_point_object(self, routing_style):
+        """Both ends of a self-loop reference one point tuple."""
+        element = _el("loop", x=200, y=200, w=120, h=80)
+
+        wps = generate_waypoints(element, element, routing_style=routing_style)
+
+        assert wps[0] is wps[1]
+
+    def test_repeated_geometry_shares_points(self):
+        """Equal geometry yields the same memoized point objects."""
+        first = generate_waypoints(_el("a", x=200, y=200), _el("a", x=200, y=200))
+        second = generate_waypoints(_el("b", x=200, y=200), _el("b", x=200, y=200))
+
+        assert first[0] is second[0]
+
 
 # ===================================================================
 # 7. Boundary coordinates (elements at pool edge / origin)
@@ -407,6 +429,11 @@ class TestCreateWaypointArray:
         """Two-point path has no intermediates -> None."""
         assert create_waypoint_array([(0, 0), (100, 100)]) is None
 
+    def test_array_returns_none_for_empty_and_single_point(self):
+        """Paths shorter than two points have no intermediates -> None."""
+        assert create_waypoint_array([]) is None
+        assert create_waypoint_array([(5, 5)]) is None
+
     def test_array_with_three_points(self):
         """Three points -> one intermediate."""
         array = create_waypoint_array([(0, 0), (50, 50), (100, 100)])
@@ -422,6 +449,22 @@ class TestCreateWaypointArray:
         assert array is not None
         assert len(array.findall("mxPoint")) == 3
 
+    def test_array_serialization(self):
+        """Points serialize with str() formatting, keeping int and float forms."""
+        array = create_waypoint_array([(0, 0), (30, 40), (50.5, 60), (0, 0)])
+        assert ET.tostring(array, encoding="unicode") == (
+            '<Array as="points"><mxPoint x="30" y="40" /><mxPoint x="50.5" y="60" /></Array>'
+        )
+
+    def test_array_accepts_tuple_of_points(self):
+        """A tuple of converted DI points is used without copying into a list."""
+        di = [{"x": "0", "y": "0"}, {"x": "40", "y": "0"}, {"x": "40", "y": "90"}]
+        wps = tuple(convert_bpmn_waypoints(di))
+        array = create_waypoint_array(wps)
+        assert array is not None
+        points = array.findall("mxPoint")
+        assert [(p.get("x"), p.get("y")) for p in points] == [("40.0", "0.0")]
+
 
 # ===================================================================
 # 10. position_edge_label
@@ -436,6 +479,14 @@ class TestPositionEdgeLabel:
         flow = _flow(name=None)
         assert position_edge_label(flow, [(0, 0), (100, 100)]) == {}
 
+    def test_unnamed_flow_result_is_mutable(self):
+        """Each unlabeled flow gets its own dict that callers may fill in."""
+        first = position_edge_label(_flow(name=None), [(0, 0), (100, 100)])
+        second = position_edge_label(_flow(name=""), [])
+
+        first["x"] = 0
+        assert second == {}
+
     def test_two_waypoints_midpoint(self):
         """Label at midpoint of two-point edge."""
         flow = _flow(name="Yes")
@@ -496,6 +547,17 @@ class TestDirectRouting:
 
         assert wps[0] == wps[1]
 
+    def test_direct_and_orthogonal_routes_do_not_collide(self):
+        """Same geometry yields each style's own route, whichever runs first."""
+        source = _el("s", x=100, y=100, w=120, h=80)
+        target = _el("t", x=400, y=300, w=120, h=80)
+
+        orthogonal = generate_waypoints(source, target)
+        direct = generate_waypoints(source, target, routing_style="direct")
+
+        assert direct == [(160, 140), (460, 340)]
+        assert generate_waypoints(source, target) == orthogonal
+
 
 # ===================================================================
 # 12. Edge cases and non-square elements
@@ -545,3 +607,63 @@ class TestEdgeCases:
         assert len(wps) == 2
         assert wps[0] == (400, 140)
         assert wps[1] == (220, 140)
+
+    @pytest.mark.parametrize(
+        "target_x, expected",
+        [
+            # tgt center 120 == src_x(60) + 60 => not strictly right: exit bottom
+            (60, [(60, 80), (90, 80), (90, 200), (120, 200)]),
+            # tgt center 121 > 120 => exit right, enter left
+            (61, [(120, 40), (90.5, 40), (90.5, 240), (61, 240)]),
+            # tgt center 0 == src_x(60) - 60 => not strictly left: exit bottom
+            (-60, [(60, 80), (30, 80), (30, 200), (0, 200)]),
+            # tgt center -1 < 0 => exit left, enter right
+            (-61, [(0, 40), (29.5, 40), (29.5, 240), (59, 240)]),
+        ],
+    )
+    def test_side_selection_thresholds(self, target_x, expected):
+        """Horizontal exit requires the target center strictly beyond the half-width."""
+        source = _el("s", x=0, y=0, w=120, h=80)
+        target = _el("t", x=target_x, y=200, w=120, h=80)
+
+        assert generate_waypoints(source, target) == expected
+
+    @pytest.mark.parametrize("target_y, expected_len", [(10, 2), (11, 4), (-10, 2), (-11, 4)])
+    def test_bend_threshold_is_strict(self, target_y, expected_len):
+        """A bend needs both deltas strictly beyond 10; exactly 10 stays straight."""
+        source = _el("s", x=0, y=0, w=120, h=80)
+        target = _el("t", x=300, y=target_y, w=120, h=80)
+
+        assert len(generate_waypoints(source, target)) == expected_len
+
+    def test_repeated_geometry_returns_independent_lists(self):
+        """Memoized results are copied, so callers may mutate their list."""
+        first = generate_waypoints(SRC_H, TGT_H)
+        first.append((0, 0))
+
+        second = generate_waypoints(SRC_H, TGT_H)
+
+        assert second == [(220, 240), (300, 240)]
+        assert second is not first
+
+    def test_clear_waypoint_cache_keeps_results(self):
+        """Clearing the memo does not change the routes computed afterwards."""
+        source = _el("s", x=100, y=100, w=120, h=80)
+        target = _el("t", x=400, y=300, w=120, h=80)
+        # Distinct objects with the same geometry get the same route
+        copy_source = _el("s2", x=100, y=100, w=120, h=80)
+        before = generate_waypoints(source, target)
+
+        clear_waypoint_cache()
+
+        assert generate_waypoints(copy_source, target) == before
+
+    def test_float_geometry_keeps_float_points(self):
+        """Cached int geometry does not leak int points to float callers."""
+        generate_waypoints(SRC_H, TGT_H)
+        source = _el("s", x=100.0, y=200.0, w=120.0, h=80.0)
+        target = _el("t", x=300.0, y=200.0, w=120.0, h=80.0)
+
+        wps = generate_waypoints(source, target)
+
+        assert all(isinstance(v, float) for point in wps for v in point)
@@ -11,9 +11,16 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import os
+import re
 import sys
+import tempfile
+import weakref
+from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +28,9 @@ try:
     from docx import Document
     from docx.document import Document as DocumentType
     from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+    from docx.oxml.xmlchemy import BaseOxmlElement
     from docx.shared import Inches, Length, Pt, RGBColor
     from docx.text.paragraph import Paragraph
     from docx.text.run import Run
@@ -31,6 +41,14 @@ except ImportError:
     )
     sys.exit(1)
 
+# Optional faster JSON parser; falls back to the stdlib when absent
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ---------------------------------------------------------------------------
 # Style constants
@@ -41,9 +59,27 @@ FONT_SIZE_HEADING1 = Pt(18)
 FONT_SIZE_HEADING2 = Pt(14)
 FONT_SIZE_HEADING3 = Pt(12)
 FONT_SIZE_METADATA = Pt(9)
+FONT_SIZE_TITLE = Pt(24)
+FONT_SIZE_EMPLOYEE_NAME = Pt(18)
+FONT_SIZE_TRANSCRIPT = Pt(10)
 COLOR_HEADING = RGBColor(0x1B, 0x3A, 0x5C)  # dark blue
 COLOR_METADATA = RGBColor(0x6B, 0x6B, 0x6B)  # grey
 COLOR_BODY = RGBColor(0x1A, 0x1A, 0x1A)
+COLOR_SEPARATOR = RGBColor(0xCC, 0xCC, 0xCC)  # light grey
+INDENT_RATIONALE = Inches(0.5)
+
+# Accepted date layouts, truncated to the 19 characters _format_date inspects
+_DATE_FORMATS = tuple(
+    fmt[:19]
+    for fmt in (
+        "%Y-%m-%d",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%dT%H:%M:%S.%f",
+        "%Y-%m-%dT%H:%M:%S%z",
+    )
+)
+# Shapes where datetime.fromisoformat agrees with the first two formats above
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}(?:T[0-9]{2}:[0-9]{2}:[0-9]{2})?")
 
 
 # ---------------------------------------------------------------------------
@@ -61,16 +97,122 @@ def _set_run_style(
     italic: bool = False,
 ) -> None:
     """Apply consistent font styling to a run."""
-    run.font.name = font_name
-    run.font.size = size
-    run.font.color.rgb = color
-    run.font.bold = bold
-    run.font.italic = italic
+    font = run.font
+    font.name = font_name
+    font.size = size
+    font.color.rgb = color
+    font.bold = bold
+    font.italic = italic
+
+
+def _on_off(tag: str, value: bool) -> BaseOxmlElement:
+    """Build an explicit on/off toggle such as <w:b/> or <w:b w:val="0"/>."""
+    return OxmlElement(tag) if value else OxmlElement(tag, attrs={qn("w:val"): "0"})
+
+
+def _rpr_template(
+    *,
+    font_name: str = FONT_BODY,
+    size: Length = FONT_SIZE_BODY,
+    color: RGBColor = COLOR_BODY,
+    bold: bool = False,
+    italic: bool = False,
+) -> BaseOxmlElement:
+    """Build a detached <w:rPr> matching what _set_run_style writes on a run."""
+    rpr = OxmlElement("w:rPr")
+    rpr.append(OxmlElement("w:rFonts", attrs={qn("w:ascii"): font_name, qn("w:hAnsi"): font_name}))
+    rpr.append(_on_off("w:b", bold))
+    rpr.append(_on_off("w:i", italic))
+    rpr.append(OxmlElement("w:color", attrs={qn("w:val"): str(color)}))
+    # w:sz is measured in half-points
+    rpr.append(OxmlElement("w:sz", attrs={qn("w:val"): str(round(size.pt * 2))}))
+    return rpr
+
+
+# Run properties for bullets and the appendix, resolved once and copied per run
+_RPR_BODY = _rpr_template()
+_RPR_BOLD = _rpr_template(bold=True)
+_RPR_METADATA = _rpr_template(size=FONT_SIZE_METADATA, color=COLOR_METADATA, italic=True)
+_RPR_TRANSCRIPT = _rpr_template(size=FONT_SIZE_TRANSCRIPT, color=COLOR_METADATA)
+
+
+def _bottom_border_template() -> BaseOxmlElement:
+    """Build a detached <w:pBdr> with a thin bottom rule in the separator colour."""
+    pbdr = OxmlElement("w:pBdr")
+    bottom = OxmlElement(
+        "w:bottom",
+        attrs={
+            qn("w:val"): "single",
+            qn("w:sz"): "6",
+            qn("w:space"): "1",
+            qn("w:color"): str(COLOR_SEPARATOR),
+        },
+    )
+    pbdr.append(bottom)
+    return pbdr
+
+
+_PBDR_SEPARATOR = _bottom_border_template()
+
+
+def _make_run(text: str, rpr: BaseOxmlElement) -> BaseOxmlElement:
+    """Build a detached <w:r> with a copy of an rPr template."""
+    r = OxmlElement("w:r")
+    r.append(deepcopy(rpr))
+    if text:
+        r.text = text  # handles tabs and line breaks like Run.text
+    return r
+
+
+def _make_para(*runs: tuple[str, BaseOxmlElement]) -> BaseOxmlElement:
+    """Build a detached <w:p> from (text, rPr template) pairs."""
+    p = OxmlElement("w:p")
+    for text, rpr in runs:
+        p.append(_make_run(text, rpr))
+    return p
+
+
+# Invariant paragraphs, built once and copied on insert
+_P_EVIDENCE_LABEL = _make_para(("Supporting Evidence:", _RPR_BOLD))
+
+
+def _insert_paras(doc: DocumentType, paras: list[BaseOxmlElement]) -> None:
+    """Append paragraphs to the document body, ahead of the section properties."""
+    body = doc.element.body
+    sect_pr = body.sectPr
+    index = len(body) if sect_pr is None else body.index(sect_pr)
+    body[index:index] = paras
+
+
+# Paragraph style ids per document part; entries are dropped with the document
+_STYLE_IDS: weakref.WeakKeyDictionary[Any, dict[str, str]] = weakref.WeakKeyDictionary()
+
+
+def _style_id(doc: DocumentType, style_name: str) -> str:
+    """Resolve a style name to its id, looking it up once per document."""
+    ids = _STYLE_IDS.setdefault(doc.part, {})
+    style_id = ids.get(style_name)
+    if style_id is None:
+        style_id = ids[style_name] = doc.styles[style_name].style_id
+    return style_id
+
+
+def _add_styled_paragraph(doc: DocumentType, style_name: str) -> Paragraph:
+    """Add an empty paragraph with a named (non-default) paragraph style.
+
+    Equivalent to ``doc.add_paragraph(style=style_name)`` but writes the
+    style id directly, skipping python-docx's scan for the default style
+    on every call.
+    """
+    para = doc.add_paragraph()
+    para._p.style = _style_id(doc, style_name)
+    return para
 
 
 def _add_heading(doc: DocumentType, text: str, level: int = 1) -> Paragraph:
     """Add a styled heading paragraph."""
-    heading: Paragraph = doc.add_heading(text, level=level)  # type: ignore[assignment]
+    heading = _add_styled_paragraph(doc, f"Heading {level}")
+    heading.add_run(text)
     for run in heading.runs:
         run.font.color.rgb = COLOR_HEADING
         run.font.name = FONT_BODY
@@ -86,30 +228,24 @@ def _add_heading(doc: DocumentType, text: str, level: int = 1) -> Paragraph:
 def _add_body(doc: DocumentType, text: str) -> Paragraph:
     """Add a body paragraph with standard styling."""
     para = doc.add_paragraph()
-    run = para.add_run(text)
-    _set_run_style(run)
+    para._p.append(_make_run(text, _RPR_BODY))
     return para
 
 
 def _add_metadata_line(doc: DocumentType, text: str) -> Paragraph:
     """Add a grey metadata line."""
     para = doc.add_paragraph()
-    run = para.add_run(text)
-    _set_run_style(run, size=FONT_SIZE_METADATA, color=COLOR_METADATA, italic=True)
+    para._p.append(_make_run(text, _RPR_METADATA))
     return para
 
 
 def _add_bullet(doc: DocumentType, text: str, *, bold_prefix: str | None = None) -> Paragraph:
     """Add a bullet-point paragraph, optionally with a bold prefix."""
-    para = doc.add_paragraph(style="List Bullet")
+    para = _add_styled_paragraph(doc, "List Bullet")
+    p = para._p
     if bold_prefix:
-        run_bold = para.add_run(bold_prefix)
-        _set_run_style(run_bold, bold=True)
-        run_rest = para.add_run(text)
-        _set_run_style(run_rest)
-    else:
-        run = para.add_run(text)
-        _set_run_style(run)
+        p.append(_make_run(bold_prefix, _RPR_BOLD))
+    p.append(_make_run(text, _RPR_BODY))
     return para
 
 
@@ -117,19 +253,39 @@ def _format_date(date_str: str) -> str:
     """Best-effort date formatting. Returns the original string on failure."""
     if not date_str:
         return "N/A"
-    for fmt in (
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S%z",
-    ):
+    if not isinstance(date_str, str):
+        return date_str
+    return _format_date_str(date_str)
+
+
+@lru_cache(maxsize=1024)
+def _format_date_str(date_str: str) -> str:
+    """Cached worker for _format_date; dates repeat across evidence lists."""
+    head = date_str[:19]
+    if _ISO_DATE_RE.fullmatch(head):
+        try:
+            return datetime.fromisoformat(head).strftime("%B %d, %Y")
+        except ValueError:
+            return date_str
+    for fmt in _DATE_FORMATS:
         try:
-            return datetime.strptime(date_str[:19], fmt[: min(len(fmt), 19)]).strftime("%B %d, %Y")
-        except (ValueError, TypeError):
+            return datetime.strptime(head, fmt).strftime("%B %d, %Y")
+        except ValueError:
             continue
     return date_str
 
 
+def _load_json(raw: bytes | str) -> Any:
+    """Parse a JSON payload, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers see
+    the same exception either way.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _safe_get(data: dict[str, Any], *keys: str, default: Any = "") -> Any:
     """Safely traverse nested dicts."""
     current: Any = data
@@ -152,13 +308,13 @@ def _build_title_page(doc: DocumentType, data: dict[str, Any]) -> None:
     title_para = doc.add_paragraph()
     title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = title_para.add_run("Employee Feedback Assessment")
-    _set_run_style(run, size=Pt(24), color=COLOR_HEADING, bold=True)
+    _set_run_style(run, size=FONT_SIZE_TITLE, color=COLOR_HEADING, bold=True)
 
     # Employee name
     name_para = doc.add_paragraph()
     name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = name_para.add_run(data.get("employee_name", "Unknown Employee"))
-    _set_run_style(run, size=Pt(18), color=COLOR_BODY)
+    _set_run_style(run, size=FONT_SIZE_EMPLOYEE_NAME, color=COLOR_BODY)
 
     # Spacer
     doc.add_paragraph()
@@ -178,8 +334,7 @@ def _build_title_page(doc: DocumentType, data: dict[str, Any]) -> None:
     for line in meta_lines:
         para = doc.add_paragraph()
         para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = para.add_run(line)
-        _set_run_style(run, size=FONT_SIZE_METADATA, color=COLOR_METADATA, italic=True)
+        para._p.append(_make_run(line, _RPR_METADATA))
 
     # Page break after title section
     doc.add_page_break()
@@ -194,6 +349,15 @@ def _build_executive_summary(doc: DocumentType, synthesis: dict[str, Any]) -> No
     _add_body(doc, summary_text)
 
 
+def _add_evidence(doc: DocumentType, evidence: list[dict[str, Any]]) -> None:
+    """Supporting Evidence label followed by one dated bullet per item."""
+    _insert_paras(doc, [deepcopy(_P_EVIDENCE_LABEL)])
+    for item in evidence:
+        date_str = _format_date(item.get("date", ""))
+        summary = item.get("summary", "")
+        _add_bullet(doc, f" {summary}", bold_prefix=f"[{date_str}]")
+
+
 def _build_strengths(doc: DocumentType, synthesis: dict[str, Any]) -> None:
     """Strengths section with evidence citations."""
     _add_heading(doc, "Strengths", level=1)
@@ -214,13 +378,7 @@ def _build_strengths(doc: DocumentType, synthesis: dict[str, Any]) -> None:
         if description:
             _add_body(doc, description)
         if evidence:
-            para = doc.add_paragraph()
-            run = para.add_run("Supporting Evidence:")
-            _set_run_style(run, bold=True, size=FONT_SIZE_BODY)
-            for item in evidence:
-                date_str = _format_date(item.get("date", ""))
-                summary = item.get("summary", "")
-                _add_bullet(doc, f" {summary}", bold_prefix=f"[{date_str}]")
+            _add_evidence(doc, evidence)
 
 
 def _build_areas_for_development(doc: DocumentType, synthesis: dict[str, Any]) -> None:
@@ -246,13 +404,7 @@ def _build_areas_for_development(doc: DocumentType, synthesis: dict[str, Any]) -
         if description:
             _add_body(doc, description)
         if evidence:
-            para = doc.add_paragraph()
-            run = para.add_run("Supporting Evidence:")
-            _set_run_style(run, bold=True, size=FONT_SIZE_BODY)
-            for item in evidence:
-                date_str = _format_date(item.get("date", ""))
-                summary = item.get("summary", "")
-                _add_bullet(doc, f" {summary}", bold_prefix=f"[{date_str}]")
+            _add_evidence(doc, evidence)
 
 
 def _build_patterns_and_themes(doc: DocumentType, synthesis: dict[str, Any]) -> None:
@@ -307,13 +459,17 @@ def _build_recommendations(doc: DocumentType, synthesis: dict[str, Any]) -> None
             _add_bullet(doc, recommendation)
             if rationale:
                 para = doc.add_paragraph()
-                para.paragraph_format.left_indent = Inches(0.5)
-                run = para.add_run(f"Rationale: {rationale}")
-                _set_run_style(run, size=FONT_SIZE_METADATA, color=COLOR_METADATA, italic=True)
+                para.paragraph_format.left_indent = INDENT_RATIONALE
+                para._p.append(_make_run(f"Rationale: {rationale}", _RPR_METADATA))
 
 
 def _build_appendix(doc: DocumentType, entries: list[dict[str, Any]]) -> None:
-    """Appendix with individual feedback entries in chronological order."""
+    """Appendix with individual feedback entries in chronological order.
+
+    Entry paragraphs are built as raw oxml from prebuilt run properties,
+    bypassing python-docx's per-run font setters; headings still go
+    through _add_heading for style resolution.
+    """
     doc.add_page_break()
     _add_heading(doc, "Appendix: Individual Feedback Entries", level=1)
 
@@ -336,44 +492,32 @@ def _build_appendix(doc: DocumentType, entries: list[dict[str, Any]]) -> None:
 
         # Entry heading
         _add_heading(doc, f"{title}", level=2)
-        _add_metadata_line(doc, f"{date_str}  |  {feedback_type}")
+        paras = [_make_para((f"{date_str}  |  {feedback_type}", _RPR_METADATA))]
 
         if tags:
             tag_str = ", ".join(tags) if isinstance(tags, list) else str(tags)
-            _add_metadata_line(doc, f"Tags: {tag_str}")
+            paras.append(_make_para((f"Tags: {tag_str}", _RPR_METADATA)))
 
         if summary:
-            para = doc.add_paragraph()
-            run_label = para.add_run("Summary: ")
-            _set_run_style(run_label, bold=True)
-            run_text = para.add_run(summary)
-            _set_run_style(run_text)
+            paras.append(_make_para(("Summary: ", _RPR_BOLD), (summary, _RPR_BODY)))
 
         if context:
-            para = doc.add_paragraph()
-            run_label = para.add_run("Context: ")
-            _set_run_style(run_label, bold=True)
-            run_text = para.add_run(context)
-            _set_run_style(run_text)
+            paras.append(_make_para(("Context: ", _RPR_BOLD), (context, _RPR_BODY)))
 
         if actionable:
-            para = doc.add_paragraph()
-            run_label = para.add_run("Actionable Items: ")
-            _set_run_style(run_label, bold=True)
-            run_text = para.add_run(actionable)
-            _set_run_style(run_text)
+            paras.append(_make_para(("Actionable Items: ", _RPR_BOLD), (actionable, _RPR_BODY)))
 
         if transcript:
+            _insert_paras(doc, paras)
             _add_heading(doc, "Raw Transcript", level=3)
-            para = doc.add_paragraph()
-            run = para.add_run(transcript)
-            _set_run_style(run, size=Pt(10), color=COLOR_METADATA)
+            paras = [_make_para((transcript, _RPR_TRANSCRIPT))]
 
-        # Separator between entries (except last)
+        # Separator between entries (except last): a bottom border on the
+        # entry's final paragraph rather than an extra paragraph
         if i < len(sorted_entries) - 1:
-            separator = doc.add_paragraph()
-            run = separator.add_run("_" * 60)
-            _set_run_style(run, color=RGBColor(0xCC, 0xCC, 0xCC), size=Pt(8))
+            paras[-1].get_or_add_pPr().append(deepcopy(_PBDR_SEPARATOR))
+
+        _insert_paras(doc, paras)
 
 
 # ---------------------------------------------------------------------------
@@ -414,7 +558,23 @@ def generate_docx(data: dict[str, Any], output_path: str) -> str:
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    doc.save(str(output))
+    # Serialize in memory, then swap into place so a failed run never
+    # leaves a truncated .docx behind
+    buf = io.BytesIO()
+    doc.save(buf)
+    # A unique temp name keeps concurrent runs and unrelated files apart
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, prefix=output.name + ".", suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(buf.getvalue())
+        # mkstemp creates the file 0600; give the report the usual umask mode
+        umask = os.umask(0)
+        os.umask(umask)
+        tmp.chmod(0o666 & ~umask)
+        tmp.replace(output)
+    finally:
+        tmp.unlink(missing_ok=True)
     return str(output.resolve())
 
 
@@ -447,10 +607,11 @@ def main() -> None:
         if not input_path.exists():
             print(f"ERROR: Input file not found: {args.input}", file=sys.stderr)
             sys.exit(1)
-        with open(input_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(input_path.read_bytes())
     else:
-        data = json.load(sys.stdin)
+        # Read raw bytes when available to skip text decoding
+        stdin = getattr(sys.stdin, "buffer", sys.stdin)
+        data = _load_json(stdin.read())
 
     # Generate document
     result_path = generate_docx(data, args.output)
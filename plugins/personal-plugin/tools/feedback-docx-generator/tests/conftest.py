@@ -1,11 +1,31 @@
 """Shared fixtures for feedback-docx-generator tests."""
 
+from typing import Any, NamedTuple
+
 import pytest
+from docx import Document
+
+from feedback_docx_generator.__main__ import generate_docx
+
+
+@pytest.fixture(scope="module")
+def blank_doc():
+    """One Document per test module for helpers that only append to it.
+
+    Loading the default template is the slow part of these tests, so
+    helper tests share the document rather than each building their own.
+    """
+    return Document()
 
 
 @pytest.fixture
 def sample_feedback_data():
     """Complete, valid feedback data with all sections populated."""
+    return _sample_feedback_data()
+
+
+def _sample_feedback_data():
+    """Build a fresh copy of the sample data (shared by function and session fixtures)."""
     return {
         "employee_name": "Jane Doe",
         "assessment_period": {
@@ -104,6 +124,34 @@ def sample_feedback_data():
     }
 
 
+class GeneratedReport(NamedTuple):
+    """A generated sample report, reopened once for read-only assertions."""
+
+    path: str
+    doc: Any
+    all_text: str
+
+
+@pytest.fixture(scope="session")
+def shared_feedback_data():
+    """Session-wide sample data for fixtures that build once; do not mutate."""
+    return _sample_feedback_data()
+
+
+@pytest.fixture(scope="session")
+def generated_report(shared_feedback_data, tmp_path_factory):
+    """Generate the sample report once per session.
+
+    Tests that only inspect the finished document share this instead of
+    each running generate_docx and reparsing the output.
+    """
+    output = tmp_path_factory.mktemp("report") / "report.docx"
+    path = generate_docx(shared_feedback_data, str(output))
+    doc = Document(path)
+    all_text = "\n".join([p.text for p in doc.paragraphs])
+    return GeneratedReport(path, doc, all_text)
+
+
 @pytest.fixture
 def empty_feedback_data():
     """Minimal data with empty/missing optional sections."""
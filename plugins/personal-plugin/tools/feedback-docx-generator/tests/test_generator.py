@@ -1,6 +1,13 @@
 """Tests for the document generation functions in __main__.py."""
 
+import gc
+import weakref
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 from docx import Document
+from docx.oxml.ns import qn
 from docx.shared import Pt, RGBColor
 
 from feedback_docx_generator.__main__ import (
@@ -8,10 +15,14 @@ from feedback_docx_generator.__main__ import (
     COLOR_METADATA,
     FONT_BODY,
     FONT_SIZE_BODY,
+    FONT_SIZE_METADATA,
+    FONT_SIZE_TRANSCRIPT,
+    _STYLE_IDS,
     _add_body,
     _add_bullet,
     _add_heading,
     _add_metadata_line,
+    _add_styled_paragraph,
     _build_appendix,
     _build_areas_for_development,
     _build_executive_summary,
@@ -20,12 +31,61 @@ from feedback_docx_generator.__main__ import (
     _build_strengths,
     _build_title_page,
     _format_date,
+    _format_date_str,
+    _rpr_template,
     _safe_get,
     _set_run_style,
     generate_docx,
 )
 
 
+# ---------------------------------------------------------------------------
+# Shared section fixtures (built once per module, read-only)
+# ---------------------------------------------------------------------------
+
+
+def _all_text(doc):
+    """All paragraph text in the document, newline-joined."""
+    return "\n".join([p.text for p in doc.paragraphs])
+
+
+def _built_section(builder, arg):
+    """Run a section builder on a fresh Document; return (doc, joined text)."""
+    doc = Document()
+    builder(doc, arg)
+    return doc, _all_text(doc)
+
+
+@pytest.fixture(scope="module")
+def strengths_text(shared_feedback_data):
+    """Strengths section built from the sample data."""
+    return _built_section(_build_strengths, shared_feedback_data["synthesis"])
+
+
+@pytest.fixture(scope="module")
+def areas_text(shared_feedback_data):
+    """Areas for Development section built from the sample data."""
+    return _built_section(_build_areas_for_development, shared_feedback_data["synthesis"])
+
+
+@pytest.fixture(scope="module")
+def patterns_text(shared_feedback_data):
+    """Patterns and Themes section built from the sample data."""
+    return _built_section(_build_patterns_and_themes, shared_feedback_data["synthesis"])
+
+
+@pytest.fixture(scope="module")
+def recommendations_text(shared_feedback_data):
+    """Recommendations section built from the sample data."""
+    return _built_section(_build_recommendations, shared_feedback_data["synthesis"])
+
+
+@pytest.fixture(scope="module")
+def appendix_text(shared_feedback_data):
+    """Appendix built from the sample data."""
+    return _built_section(_build_appendix, shared_feedback_data["entries"])
+
+
 # ---------------------------------------------------------------------------
 # Helper function tests
 # ---------------------------------------------------------------------------
@@ -65,6 +125,28 @@ class TestFormatDate:
         """Test that partial date strings are returned as-is."""
         assert _format_date("2025-13-45") == "2025-13-45"
 
+    def test_space_separated_datetime_returns_original(self):
+        """Test that only the 'T' separator is accepted, as with strptime."""
+        assert _format_date("2025-07-15 14:30:00") == "2025-07-15 14:30:00"
+
+    def test_single_digit_month_and_day(self):
+        """Test that non-padded dates still parse via the strptime fallback."""
+        assert _format_date("2025-7-5") == "July 05, 2025"
+
+    def test_non_string_returned_unchanged(self):
+        """Test that non-string values are returned as-is."""
+        assert _format_date(12) == 12
+        assert _format_date(["2025-07-15"]) == ["2025-07-15"]
+
+    def test_repeated_dates_hit_cache(self):
+        """Test that repeated dates are served from the cache."""
+        _format_date_str.cache_clear()
+        for _ in range(3):
+            assert _format_date("2025-02-15") == "February 15, 2025"
+        info = _format_date_str.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
 
 class TestSafeGet:
     """Tests for _safe_get."""
@@ -98,9 +180,9 @@ class TestSafeGet:
 class TestSetRunStyle:
     """Tests for _set_run_style."""
 
-    def test_default_style(self):
+    def test_default_style(self, blank_doc):
         """Test default style application."""
-        doc = Document()
+        doc = blank_doc
         para = doc.add_paragraph()
         run = para.add_run("Test")
         _set_run_style(run)
@@ -111,18 +193,18 @@ class TestSetRunStyle:
         assert run.font.bold is not True
         assert run.font.italic is not True
 
-    def test_bold_style(self):
+    def test_bold_style(self, blank_doc):
         """Test bold style application."""
-        doc = Document()
+        doc = blank_doc
         para = doc.add_paragraph()
         run = para.add_run("Bold")
         _set_run_style(run, bold=True)
 
         assert run.font.bold is True
 
-    def test_custom_color_and_size(self):
+    def test_custom_color_and_size(self, blank_doc):
         """Test custom color and size."""
-        doc = Document()
+        doc = blank_doc
         para = doc.add_paragraph()
         run = para.add_run("Custom")
         custom_color = RGBColor(0xFF, 0x00, 0x00)
@@ -133,32 +215,89 @@ class TestSetRunStyle:
         assert run.font.size == custom_size
 
 
+class TestRprTemplate:
+    """Tests for _rpr_template."""
+
+    @pytest.mark.parametrize(
+        "style",
+        [
+            {},
+            {"bold": True},
+            {"size": FONT_SIZE_METADATA, "color": COLOR_METADATA, "italic": True},
+            {"size": FONT_SIZE_TRANSCRIPT, "color": COLOR_METADATA},
+        ],
+    )
+    def test_matches_set_run_style(self, blank_doc, style):
+        """Test that a template carries the same rPr _set_run_style writes."""
+        run = blank_doc.add_paragraph().add_run()
+        _set_run_style(run, **style)
+
+        def children(rpr):
+            return [(child.tag, dict(child.attrib)) for child in rpr]
+
+        assert children(_rpr_template(**style)) == children(run._r.rPr)
+
+
 # ---------------------------------------------------------------------------
 # Document element tests
 # ---------------------------------------------------------------------------
 
 
+class TestAddStyledParagraph:
+    """Tests for _add_styled_paragraph."""
+
+    @pytest.mark.parametrize("style_name", ["List Bullet", "Heading 1", "Heading 3"])
+    def test_matches_add_paragraph_with_style(self, style_name):
+        """Test that the direct style id matches python-docx's own resolution."""
+        doc = Document()
+        fast = _add_styled_paragraph(doc, style_name)
+        slow = doc.add_paragraph(style=style_name)
+
+        assert fast.style.name == style_name
+        assert fast._p.xml == slow._p.xml
+
+    def test_style_ids_cached_per_document(self):
+        """Test that style ids are resolved once per document and released with it."""
+        doc = Document()
+        _add_styled_paragraph(doc, "List Bullet")
+        _add_styled_paragraph(doc, "List Bullet")
+
+        assert _STYLE_IDS[doc.part] == {"List Bullet": "ListBullet"}
+        other = Document()
+        assert other.part not in _STYLE_IDS
+
+        part = weakref.ref(doc.part)
+        del doc
+        gc.collect()
+        assert part() is None
+
+    def test_unknown_style_raises(self):
+        """Test that an unknown style name raises KeyError."""
+        with pytest.raises(KeyError):
+            _add_styled_paragraph(Document(), "No Such Style")
+
+
 class TestAddHeading:
     """Tests for _add_heading."""
 
-    def test_level_1_heading(self):
+    def test_level_1_heading(self, blank_doc):
         """Test level 1 heading creation."""
-        doc = Document()
+        doc = blank_doc
         heading = _add_heading(doc, "Test Heading", level=1)
         assert heading is not None
         # Verify the text content
         text = heading.text
         assert "Test Heading" in text
 
-    def test_level_2_heading(self):
+    def test_level_2_heading(self, blank_doc):
         """Test level 2 heading creation."""
-        doc = Document()
+        doc = blank_doc
         heading = _add_heading(doc, "Sub Heading", level=2)
         assert heading is not None
 
-    def test_level_3_heading(self):
+    def test_level_3_heading(self, blank_doc):
         """Test level 3 heading creation."""
-        doc = Document()
+        doc = blank_doc
         heading = _add_heading(doc, "Sub-sub Heading", level=3)
         assert heading is not None
 
@@ -166,9 +305,9 @@ class TestAddHeading:
 class TestAddBody:
     """Tests for _add_body."""
 
-    def test_adds_paragraph(self):
+    def test_adds_paragraph(self, blank_doc):
         """Test that body paragraph is added."""
-        doc = Document()
+        doc = blank_doc
         para = _add_body(doc, "Body text here")
         assert para is not None
         assert para.runs[0].text == "Body text here"
@@ -177,9 +316,9 @@ class TestAddBody:
 class TestAddMetadataLine:
     """Tests for _add_metadata_line."""
 
-    def test_metadata_style(self):
+    def test_metadata_style(self, blank_doc):
         """Test metadata line styling."""
-        doc = Document()
+        doc = blank_doc
         para = _add_metadata_line(doc, "Generated: 2025-01-01")
         run = para.runs[0]
         assert run.font.italic is True
@@ -189,15 +328,15 @@ class TestAddMetadataLine:
 class TestAddBullet:
     """Tests for _add_bullet."""
 
-    def test_simple_bullet(self):
+    def test_simple_bullet(self, blank_doc):
         """Test simple bullet without bold prefix."""
-        doc = Document()
+        doc = blank_doc
         para = _add_bullet(doc, "Bullet text")
         assert para.runs[0].text == "Bullet text"
 
-    def test_bullet_with_bold_prefix(self):
+    def test_bullet_with_bold_prefix(self, blank_doc):
         """Test bullet with bold prefix."""
-        doc = Document()
+        doc = blank_doc
         para = _add_bullet(doc, " rest of text", bold_prefix="[2025-01-01]")
         assert para.runs[0].text == "[2025-01-01]"
         assert para.runs[0].font.bold is True
@@ -217,7 +356,7 @@ class TestBuildTitlePage:
         doc = Document()
         _build_title_page(doc, sample_feedback_data)
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "Employee Feedback Assessment" in all_text
         assert "Jane Doe" in all_text
 
@@ -226,7 +365,7 @@ class TestBuildTitlePage:
         doc = Document()
         _build_title_page(doc, sample_feedback_data)
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "5 feedback entries" in all_text
 
     def test_title_page_single_entry(self):
@@ -235,7 +374,7 @@ class TestBuildTitlePage:
         data = {"employee_name": "Test", "total_entries": 1}
         _build_title_page(doc, data)
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "1 feedback entry" in all_text
 
     def test_title_page_missing_name(self):
@@ -243,7 +382,7 @@ class TestBuildTitlePage:
         doc = Document()
         _build_title_page(doc, {})
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "Unknown Employee" in all_text
 
 
@@ -255,7 +394,7 @@ class TestBuildExecutiveSummary:
         doc = Document()
         _build_executive_summary(doc, sample_feedback_data["synthesis"])
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "Executive Summary" in all_text
         assert "strong leadership" in all_text
 
@@ -264,38 +403,40 @@ class TestBuildExecutiveSummary:
         doc = Document()
         _build_executive_summary(doc, {})
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "No executive summary provided." in all_text
 
 
 class TestBuildStrengths:
     """Tests for _build_strengths."""
 
-    def test_with_strengths(self, sample_feedback_data):
+    def test_with_strengths(self, strengths_text):
         """Test strengths section with data."""
-        doc = Document()
-        _build_strengths(doc, sample_feedback_data["synthesis"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = strengths_text
         assert "Strengths" in all_text
         assert "Technical Leadership" in all_text
         assert "Communication" in all_text
 
-    def test_strength_evidence(self, sample_feedback_data):
+    def test_strength_evidence(self, strengths_text):
         """Test that strength evidence is rendered."""
-        doc = Document()
-        _build_strengths(doc, sample_feedback_data["synthesis"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = strengths_text
         assert "Supporting Evidence" in all_text
         assert "microservices" in all_text
 
+    def test_evidence_label_per_strength(self, strengths_text):
+        """Test that each strength gets its own bold evidence label."""
+        doc, _ = strengths_text
+
+        labels = [p for p in doc.paragraphs if p.text == "Supporting Evidence:"]
+        assert len(labels) == 2
+        assert all(p.runs[0].font.bold is True for p in labels)
+
     def test_no_strengths(self):
         """Test empty strengths message."""
         doc = Document()
         _build_strengths(doc, {"strengths": []})
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "No strengths identified" in all_text
 
     def test_strength_without_name_uses_default(self):
@@ -304,19 +445,16 @@ class TestBuildStrengths:
         synthesis = {"strengths": [{"description": "Some strength"}]}
         _build_strengths(doc, synthesis)
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "Strength 1" in all_text
 
 
 class TestBuildAreasForDevelopment:
     """Tests for _build_areas_for_development."""
 
-    def test_with_areas(self, sample_feedback_data):
+    def test_with_areas(self, areas_text):
         """Test areas for development with data."""
-        doc = Document()
-        _build_areas_for_development(doc, sample_feedback_data["synthesis"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = areas_text
         assert "Areas for Development" in all_text
         assert "Time Management" in all_text
 
@@ -325,19 +463,16 @@ class TestBuildAreasForDevelopment:
         doc = Document()
         _build_areas_for_development(doc, {"areas_for_development": []})
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "No areas for development identified" in all_text
 
 
 class TestBuildPatternsAndThemes:
     """Tests for _build_patterns_and_themes."""
 
-    def test_with_patterns(self, sample_feedback_data):
+    def test_with_patterns(self, patterns_text):
         """Test patterns section with data."""
-        doc = Document()
-        _build_patterns_and_themes(doc, sample_feedback_data["synthesis"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = patterns_text
         assert "Patterns and Themes" in all_text
         assert "Trends Over Time" in all_text
         assert "delegation" in all_text
@@ -347,29 +482,23 @@ class TestBuildPatternsAndThemes:
         doc = Document()
         _build_patterns_and_themes(doc, {"patterns_and_themes": {}})
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "Insufficient data" in all_text
 
 
 class TestBuildRecommendations:
     """Tests for _build_recommendations."""
 
-    def test_all_recommendation_types(self, sample_feedback_data):
+    def test_all_recommendation_types(self, recommendations_text):
         """Test that all recommendation types are rendered."""
-        doc = Document()
-        _build_recommendations(doc, sample_feedback_data["synthesis"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = recommendations_text
         assert "Continue" in all_text
         assert "Develop" in all_text
         assert "Stretch" in all_text
 
-    def test_recommendation_rationale(self, sample_feedback_data):
+    def test_recommendation_rationale(self, recommendations_text):
         """Test that rationale is included."""
-        doc = Document()
-        _build_recommendations(doc, sample_feedback_data["synthesis"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = recommendations_text
         assert "Rationale" in all_text
         assert "track record" in all_text
 
@@ -378,7 +507,7 @@ class TestBuildRecommendations:
         doc = Document()
         _build_recommendations(doc, {"recommendations": []})
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "No specific recommendations" in all_text
 
     def test_unknown_recommendation_type_excluded(self):
@@ -394,7 +523,7 @@ class TestBuildRecommendations:
         }
         _build_recommendations(doc, synthesis)
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         # Unknown types are not in the iteration order, so they are not rendered
         assert "Do something custom." not in all_text
 
@@ -410,7 +539,7 @@ class TestBuildRecommendations:
         }
         _build_recommendations(doc, synthesis)
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "Develop" in all_text
         assert "Improve testing." in all_text
 
@@ -418,60 +547,45 @@ class TestBuildRecommendations:
 class TestBuildAppendix:
     """Tests for _build_appendix."""
 
-    def test_appendix_entries(self, sample_feedback_data):
+    def test_appendix_entries(self, appendix_text):
         """Test that appendix entries are rendered."""
-        doc = Document()
-        _build_appendix(doc, sample_feedback_data["entries"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = appendix_text
         assert "Appendix" in all_text
         assert "Architecture Review" in all_text
         assert "Sprint Retrospective" in all_text
 
-    def test_appendix_sorted_chronologically(self, sample_feedback_data):
+    def test_appendix_sorted_chronologically(self, appendix_text):
         """Test that entries are sorted by date."""
-        doc = Document()
-        _build_appendix(doc, sample_feedback_data["entries"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        doc, _ = appendix_text
         # Architecture Review (2025-02-15) should appear before Sprint Retro (2025-05-01)
-        arch_pos = all_text.index("Architecture Review")
-        sprint_pos = all_text.index("Sprint Retrospective")
-        assert arch_pos < sprint_pos
+        titles = ("Architecture Review", "Sprint Retrospective")
+        order = [p.text for p in doc.paragraphs if p.text in titles]
+        assert order == list(titles)
 
     def test_appendix_no_entries(self):
         """Test empty entries message."""
         doc = Document()
         _build_appendix(doc, [])
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "No individual entries to display." in all_text
 
-    def test_appendix_entry_details(self, sample_feedback_data):
+    def test_appendix_entry_details(self, appendix_text):
         """Test that entry details are rendered."""
-        doc = Document()
-        _build_appendix(doc, sample_feedback_data["entries"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = appendix_text
         assert "Summary:" in all_text
         assert "Context:" in all_text
         assert "Actionable Items:" in all_text
 
-    def test_appendix_tags(self, sample_feedback_data):
+    def test_appendix_tags(self, appendix_text):
         """Test that tags are rendered."""
-        doc = Document()
-        _build_appendix(doc, sample_feedback_data["entries"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = appendix_text
         assert "leadership" in all_text
         assert "architecture" in all_text
 
-    def test_appendix_raw_transcript(self, sample_feedback_data):
+    def test_appendix_raw_transcript(self, appendix_text):
         """Test that raw transcript is rendered."""
-        doc = Document()
-        _build_appendix(doc, sample_feedback_data["entries"])
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        _, all_text = appendix_text
         assert "Raw Transcript" in all_text
         assert "Jane presented" in all_text
 
@@ -481,19 +595,75 @@ class TestBuildAppendix:
         entries = [{"title": "Test", "tags": "single-tag", "date": "2025-01-01"}]
         _build_appendix(doc, entries)
 
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = _all_text(doc)
         assert "single-tag" in all_text
 
-    def test_appendix_separator_not_after_last(self, sample_feedback_data):
-        """Test that separator line count is len(entries)-1."""
+    def test_appendix_separator_not_after_last(self, appendix_text, sample_feedback_data):
+        """Test that separator border count is len(entries)-1."""
+        doc, _ = appendix_text
+
+        borders = doc.element.body.xpath(".//w:pPr/w:pBdr/w:bottom")
+        assert len(borders) == len(sample_feedback_data["entries"]) - 1
+        assert borders[0].get(qn("w:color")) == "CCCCCC"
+        assert not any("_" * 60 in p.text for p in doc.paragraphs)
+
+    def test_appendix_separator_on_last_paragraph_of_entry(self, appendix_text):
+        """Test that the border sits on the paragraph before the next entry heading."""
+        doc, _ = appendix_text
+
+        paras = doc.paragraphs
+        bordered = [i for i, p in enumerate(paras) if p._p.xpath("./w:pPr/w:pBdr")]
+        assert [paras[i + 1].text for i in bordered] == ["Sprint Retrospective"]
+        assert paras[bordered[0]].text == "The meeting went well. Jane presented..."
+
+    def test_appendix_run_styles(self, appendix_text):
+        """Test that raw-oxml appendix runs carry the expected fonts."""
+        doc, _ = appendix_text
+
+        paras = {p.text: p for p in doc.paragraphs}
+        label, text = paras["Summary: Led a successful architecture review meeting."].runs
+        assert label.font.bold is True
+        assert text.font.bold is False
+        assert text.font.name == FONT_BODY
+        assert text.font.size == FONT_SIZE_BODY
+        assert text.font.color.rgb == COLOR_BODY
+
+        meta = paras["Tags: leadership, architecture"].runs[0]
+        assert meta.font.italic is True
+        assert meta.font.color.rgb == COLOR_METADATA
+
+    def test_appendix_runs_do_not_share_rpr(self, sample_feedback_data):
+        """Test that each run gets its own copy of the run properties."""
         doc = Document()
         _build_appendix(doc, sample_feedback_data["entries"])
 
-        # Count separator paragraphs (runs with "_" * 60)
-        separator_count = sum(
-            1 for p in doc.paragraphs if p.runs and "_" * 60 in p.runs[0].text
-        )
-        assert separator_count == len(sample_feedback_data["entries"]) - 1
+        paras = {p.text: p for p in doc.paragraphs}
+        summary = paras["Summary: Led a successful architecture review meeting."]
+        context = paras["Context: Quarterly architecture review for the platform team."]
+        summary.runs[1].font.italic = True
+
+        assert context.runs[1].font.italic is False
+        fresh = Document()
+        _build_appendix(fresh, sample_feedback_data["entries"])
+        fresh_summary = next(p for p in fresh.paragraphs if p.text == summary.text)
+        assert fresh_summary.runs[1].font.italic is False
+
+    def test_appendix_transcript_line_breaks(self):
+        """Test that transcript newlines and tabs become Word breaks and tabs."""
+        doc = Document()
+        _build_appendix(doc, [{"title": "T", "raw_transcript": "one\ntwo\tthree"}])
+
+        run = next(r for p in doc.paragraphs for r in p.runs if "one" in r.text)
+        assert run.text == "one\ntwo\tthree"
+        assert run._r.xpath("./w:br")
+        assert run._r.xpath("./w:tab")
+
+    def test_appendix_paragraphs_before_section_properties(self, appendix_text):
+        """Test that appendix paragraphs are inserted ahead of w:sectPr."""
+        doc, _ = appendix_text
+
+        body = doc.element.body
+        assert body[-1].tag.endswith("}sectPr")
 
 
 # ---------------------------------------------------------------------------
@@ -504,15 +674,11 @@ class TestBuildAppendix:
 class TestGenerateDocx:
     """Tests for generate_docx."""
 
-    def test_generates_valid_docx(self, sample_feedback_data, temp_output_dir):
+    def test_generates_valid_docx(self, generated_report):
         """Test that a valid .docx file is created."""
-        output_path = str(temp_output_dir / "test_report.docx")
-        result = generate_docx(sample_feedback_data, output_path)
-
-        assert result.endswith("test_report.docx")
+        assert generated_report.path.endswith("report.docx")
         # Verify the file is a valid docx
-        doc = Document(result)
-        assert len(doc.paragraphs) > 0
+        assert len(generated_report.doc.paragraphs) > 0
 
     def test_creates_output_directory(self, sample_feedback_data, tmp_path):
         """Test that parent directories are created if needed."""
@@ -528,13 +694,9 @@ class TestGenerateDocx:
         doc = Document(result)
         assert len(doc.paragraphs) > 0
 
-    def test_all_major_sections_present(self, sample_feedback_data, temp_output_dir):
+    def test_all_major_sections_present(self, generated_report):
         """Test that all major document sections are present."""
-        output_path = str(temp_output_dir / "sections_report.docx")
-        result = generate_docx(sample_feedback_data, output_path)
-        doc = Document(result)
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
+        all_text = generated_report.all_text
         expected_sections = [
             "Employee Feedback Assessment",
             "Executive Summary",
@@ -547,22 +709,44 @@ class TestGenerateDocx:
         for section in expected_sections:
             assert section in all_text, f"Missing section: {section}"
 
-    def test_footer_metadata(self, sample_feedback_data, temp_output_dir):
+    def test_footer_metadata(self, generated_report):
         """Test that footer metadata line is present."""
-        output_path = str(temp_output_dir / "footer_report.docx")
-        result = generate_docx(sample_feedback_data, output_path)
-        doc = Document(result)
-
-        all_text = "\n".join(p.text for p in doc.paragraphs)
-        assert "Generated by Feedback Synthesis" in all_text
+        assert "Generated by Feedback Synthesis" in generated_report.all_text
 
-    def test_default_document_style(self, sample_feedback_data, temp_output_dir):
+    def test_default_document_style(self, generated_report):
         """Test that default Normal style is set correctly."""
-        output_path = str(temp_output_dir / "style_report.docx")
-        result = generate_docx(sample_feedback_data, output_path)
-        doc = Document(result)
-
-        normal_style = doc.styles["Normal"]
+        normal_style = generated_report.doc.styles["Normal"]
         assert normal_style.font.name == FONT_BODY
         assert normal_style.font.size == FONT_SIZE_BODY
         assert normal_style.font.color.rgb == COLOR_BODY
+
+    def test_no_temp_file_left_behind(self, generated_report):
+        """Test that the atomic write leaves only the final .docx."""
+        output_dir = Path(generated_report.path).parent
+        assert [p.name for p in output_dir.iterdir()] == ["report.docx"]
+
+    def test_failed_write_keeps_existing_file(self, sample_feedback_data, temp_output_dir):
+        """Test that an existing output survives a failed write untouched."""
+        output = temp_output_dir / "report.docx"
+        output.write_bytes(b"previous")
+
+        with patch("pathlib.Path.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                generate_docx(sample_feedback_data, str(output))
+
+        assert output.read_bytes() == b"previous"
+        assert [p.name for p in temp_output_dir.iterdir()] == ["report.docx"]
+
+    def test_existing_tmp_sibling_untouched(self, sample_feedback_data, temp_output_dir):
+        """Test that a user's own <name>.docx.tmp is neither overwritten nor removed."""
+        output = temp_output_dir / "report.docx"
+        sibling = temp_output_dir / "report.docx.tmp"
+        sibling.write_bytes(b"mine")
+
+        generate_docx(sample_feedback_data, str(output))
+
+        assert sibling.read_bytes() == b"mine"
+        assert sorted(p.name for p in temp_output_dir.iterdir()) == [
+            "report.docx",
+            "report.docx.tmp",
+        ]
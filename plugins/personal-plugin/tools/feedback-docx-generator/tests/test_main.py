@@ -1,7 +1,7 @@
 """Tests for the CLI entry point (__main__.py main function)."""
 
 import json
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from unittest.mock import patch
 
 import pytest
@@ -9,11 +9,17 @@ import pytest
 from feedback_docx_generator.__main__ import main
 
 
+@pytest.fixture(scope="session")
+def sample_feedback_json(shared_feedback_data):
+    """The sample data encoded as UTF-8 JSON once per session."""
+    return json.dumps(shared_feedback_data).encode("utf-8")
+
+
 @pytest.fixture
-def input_json_file(tmp_path, sample_feedback_data):
+def input_json_file(tmp_path, sample_feedback_json):
     """Create a temporary JSON input file."""
     filepath = tmp_path / "input.json"
-    filepath.write_text(json.dumps(sample_feedback_data), encoding="utf-8")
+    filepath.write_bytes(sample_feedback_json)
     return filepath
 
 
@@ -71,10 +77,10 @@ class TestCLIExecution:
         doc = Document(output_path)
         assert len(doc.paragraphs) > 0
 
-    def test_from_stdin(self, sample_feedback_data, tmp_path):
+    def test_from_stdin(self, sample_feedback_json, tmp_path):
         """Test generation from stdin."""
         output_path = str(tmp_path / "stdin_output.docx")
-        json_data = json.dumps(sample_feedback_data)
+        json_data = sample_feedback_json.decode("utf-8")
 
         with patch("sys.argv", ["prog", "--output", output_path]):
             with patch("sys.stdin", StringIO(json_data)):
@@ -123,26 +129,38 @@ class TestCLIExecution:
 
         assert Path(output_path).exists()
 
-    def test_invalid_json_raises(self, tmp_path):
-        """Test that invalid JSON input causes an error."""
-        bad_file = tmp_path / "bad.json"
-        bad_file.write_text("not valid json {{{", encoding="utf-8")
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    @pytest.mark.parametrize("via", ["file", "stdin"])
+    def test_invalid_json_raises(self, tmp_path, via, orjson_available):
+        """Test that invalid JSON from a file or stdin raises json.JSONDecodeError."""
+        if orjson_available:
+            pytest.importorskip("orjson")
         output_path = str(tmp_path / "output.docx")
+        argv = ["prog", "--output", output_path]
+        if via == "file":
+            bad_file = tmp_path / "bad.json"
+            bad_file.write_text("not valid json {{{", encoding="utf-8")
+            argv += ["--input", str(bad_file)]
+
+        with patch("sys.argv", argv), patch("sys.stdin", StringIO("not valid json")):
+            with patch(
+                "feedback_docx_generator.__main__.ORJSON_AVAILABLE", orjson_available
+            ):
+                with pytest.raises(json.JSONDecodeError):
+                    main()
 
-        with patch(
-            "sys.argv", ["prog", "--input", str(bad_file), "--output", output_path]
-        ):
-            with pytest.raises(json.JSONDecodeError):
+    def test_from_stdin_buffer(self, sample_feedback_json, tmp_path):
+        """Test that stdin is read from its binary buffer when present."""
+        output_path = str(tmp_path / "stdin_output.docx")
+        stdin = TextIOWrapper(BytesIO(sample_feedback_json))
+
+        with patch("sys.argv", ["prog", "--output", output_path]):
+            with patch("sys.stdin", stdin):
                 main()
 
-    def test_invalid_json_from_stdin(self, tmp_path):
-        """Test that invalid JSON from stdin causes an error."""
-        output_path = str(tmp_path / "output.docx")
+        from pathlib import Path
 
-        with patch("sys.argv", ["prog", "--output", output_path]):
-            with patch("sys.stdin", StringIO("not valid json")):
-                with pytest.raises(json.JSONDecodeError):
-                    main()
+        assert Path(output_path).exists()
 
     def test_stderr_message_on_missing_file(self, tmp_path, capsys):
         """Test that missing file error goes to stderr."""
@@ -181,7 +199,7 @@ class TestCLIEdgeCases:
     """Tests for edge cases in CLI."""
 
     def test_malformed_data_from_file(self, tmp_path, malformed_feedback_data):
-        """Test that malformed data still produces output (graceful degradation)."""
+        """Test that the malformed fixture fails on the non-string employee name."""
         input_file = tmp_path / "malformed.json"
         input_file.write_text(json.dumps(malformed_feedback_data), encoding="utf-8")
         output_path = str(tmp_path / "malformed_output.docx")
@@ -190,11 +208,30 @@ class TestCLIEdgeCases:
             "sys.argv",
             ["prog", "--input", str(input_file), "--output", output_path],
         ):
-            # The tool should handle gracefully since it uses .get() with defaults
-            # The entries field is "not-a-list" which sorted() can handle for strings
-            # but the iteration expects dicts, so this may raise
-            try:
+            with pytest.raises(TypeError):
                 main()
-            except (TypeError, AttributeError):
-                # Expected for truly malformed data (e.g., "entries" as string)
-                pass
+
+    @pytest.mark.parametrize(
+        "bad, exc",
+        [
+            ({"employee_name": 12345}, TypeError),
+            ({"assessment_period": "not-a-dict"}, AttributeError),
+            ({"synthesis": 123}, AttributeError),
+            ({"synthesis": {"strengths": "not-a-list"}}, AttributeError),
+            ({"entries": "not-a-list"}, AttributeError),
+        ],
+    )
+    def test_malformed_shapes_raise(self, tmp_path, bad, exc):
+        """Test the exact error raised for each malformed input shape."""
+        input_file = tmp_path / "malformed.json"
+        input_file.write_text(json.dumps(bad), encoding="utf-8")
+        output_path = tmp_path / "malformed_output.docx"
+
+        with patch(
+            "sys.argv",
+            ["prog", "--input", str(input_file), "--output", str(output_path)],
+        ):
+            with pytest.raises(exc):
+                main()
+
+        assert not output_path.exists()
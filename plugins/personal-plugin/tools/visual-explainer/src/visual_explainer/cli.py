@@ -19,7 +19,6 @@ Uses Rich for formatted output (progress bars, tables, panels).
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
 import os
 import re
@@ -1628,6 +1627,9 @@ def main() -> int:
 
         return handle_setup_keys_flag()
 
+    # Deferred so --help, --version and --setup-keys skip the asyncio import
+    import asyncio
+
     # Handle --resume flag
     if args.resume:
         checkpoint_path = Path(args.resume)